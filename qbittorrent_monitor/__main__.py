@@ -20,8 +20,9 @@ import asyncio
 import logging
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import NoReturn, Optional
+from typing import Any, Dict, NoReturn, Optional
 
 # 导入项目主模块
 from qbittorrent_monitor import __version__, PROJECT_DESCRIPTION
@@ -39,6 +40,15 @@ logger = logging.getLogger(__name__)
 # 全局标志用于优雅退出
 _shutdown_requested = False
 
+# 信号编号到名称的映射，避免在信号处理路径上构造枚举
+_SIG_NAMES = {sig.value: sig.name for sig in signal.Signals}
+
+# 安装前的信号处理器，用于退出时恢复；非空表示已安装
+_previous_handlers: Dict[int, Any] = {}
+
+# 当前运行的监控器，收到信号时通知其停止
+_active_monitor: Optional[ClipboardMonitor] = None
+
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     """配置日志系统，包含敏感信息过滤。"""
@@ -68,23 +78,64 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         root_logger.addHandler(file_handler)
 
 
+def _safe_flush(handler: logging.Handler) -> None:
+    """刷新单个日志处理器，忽略刷新异常。"""
+    try:
+        handler.flush()
+    except Exception:
+        pass
+
+
+def flush_log_handlers() -> None:
+    """刷新根日志记录器的所有处理器。
+
+    存在多个处理器时并行刷新，总耗时取决于最慢的处理器而不是所有处理器之和。
+    """
+    handlers = list(logging.getLogger().handlers)
+    if len(handlers) <= 1:
+        for handler in handlers:
+            _safe_flush(handler)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(handlers), thread_name_prefix="log-flush") as executor:
+        list(executor.map(_safe_flush, handlers))
+
+
 def signal_handler(signum: int, frame) -> None:
     """处理系统信号，实现优雅退出。"""
     global _shutdown_requested
-    sig_name = signal.Signals(signum).name
+    sig_name = _SIG_NAMES.get(signum, str(signum))
     logger.info(f"收到信号 {sig_name} ({signum})，正在优雅退出...")
     _shutdown_requested = True
+    if _active_monitor is not None:
+        _active_monitor.stop()
 
 
 def setup_signal_handlers() -> None:
-    """设置信号处理器。"""
+    """设置信号处理器。
+
+    重复调用不会重复安装；原有处理器会被保存，以便 restore_signal_handlers 恢复。
+    """
+    if _previous_handlers:
+        return
+
     # 注册 SIGINT (Ctrl+C) 和 SIGTERM 处理器
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    signals = [signal.SIGINT, signal.SIGTERM]
 
     # Windows 平台也支持 SIGBREAK
     if hasattr(signal, 'SIGBREAK'):
-        signal.signal(signal.SIGBREAK, signal_handler)
+        signals.append(signal.SIGBREAK)
+
+    for sig in signals:
+        _previous_handlers[sig] = signal.getsignal(sig)
+        signal.signal(sig, signal_handler)
+
+
+def restore_signal_handlers() -> None:
+    """恢复 setup_signal_handlers 安装前的信号处理器。"""
+    while _previous_handlers:
+        sig, previous = _previous_handlers.popitem()
+        signal.signal(sig, previous if previous is not None else signal.SIG_DFL)
 
 
 async def async_main() -> int:
@@ -153,16 +204,21 @@ async def async_main() -> int:
     # 设置日志
     setup_logging(args.log_level, args.log_file)
 
-    # 打印启动信息
-    print("=" * 50)
-    print(f"{PROJECT_DESCRIPTION}")
-    print(f"版本: {__version__}")
-    print(f"模块入口: python -m qbittorrent_monitor")
-    print("=" * 50)
+    # 打印启动信息（拼接后一次写出）
+    banner = [
+        "=" * 50,
+        PROJECT_DESCRIPTION,
+        f"版本: {__version__}",
+        "模块入口: python -m qbittorrent_monitor",
+        "=" * 50,
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
 
     # 设置信号处理器
     setup_signal_handlers()
 
+    global _active_monitor
     try:
         # 加载配置
         config_path = Path(args.config) if args.config else None
@@ -186,6 +242,7 @@ async def async_main() -> int:
 
             # 创建并启动监控器
             monitor = ClipboardMonitor(qb, config)
+            _active_monitor = monitor
 
             # 注册统计回调
             def on_added(magnet: str, category: str) -> None:
@@ -211,6 +268,9 @@ async def async_main() -> int:
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        _active_monitor = None
+        restore_signal_handlers()
 
     return 0
 
@@ -233,6 +293,9 @@ def main() -> NoReturn:
         print(f"严重错误: {e}", file=sys.stderr)
         exit_code = 1
 
+    # 退出前确保日志落盘
+    flush_log_handlers()
+
     # 使用适当的退出码退出
     sys.exit(exit_code)
 
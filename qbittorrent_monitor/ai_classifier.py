@@ -119,10 +119,7 @@ class OpenAICompatibleClassifier(BaseAIClassifier, ABC):
             return None
 
         async def _api_call():
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None, lambda: self._execute_api_call(client, prompt)
-            )
+            return await asyncio.to_thread(self._execute_api_call, client, prompt)
 
         try:
             return await self._circuit_breaker.call(_api_call)
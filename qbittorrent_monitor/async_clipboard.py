@@ -158,12 +158,9 @@ class SmartClipboardMonitor:
         if len(self._activity_window) < 2:
             return self._max_interval
         
-        # 计算最近活动的平均间隔
-        intervals = [
-            self._activity_window[i] - self._activity_window[i-1]
-            for i in range(1, len(self._activity_window))
-        ]
-        avg_interval = sum(intervals) / len(intervals)
+        # 计算最近活动的平均间隔（相邻差值之和即首尾之差，无需逐项求差）
+        window = self._activity_window
+        avg_interval = (window[-1] - window[0]) / (len(window) - 1)
         
         # 根据活跃度调整
         if avg_interval < 0.5:  # 高频活动
@@ -9,30 +9,33 @@ import logging
 import re
 import time
 from collections import OrderedDict
-from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any
-from functools import lru_cache
 
 import anthropic
 
 from .config import Config
-from .exceptions_unified import AIError, AIFallbackError
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class ClassificationResult:
     """分类结果"""
-    category: str
-    confidence: float  # 置信度 0.0-1.0
-    method: str  # "rule", "ai", "fallback"
-    cached: bool = False
-    timestamp: float = 0.0
     
-    def __post_init__(self):
-        if self.timestamp == 0.0:
-            self.timestamp = time.time()
+    __slots__ = ("category", "confidence", "method", "cached", "timestamp")
+    
+    def __init__(
+        self,
+        category: str,
+        confidence: float,  # 置信度 0.0-1.0
+        method: str,  # "rule", "ai", "fallback"
+        cached: bool = False,
+        timestamp: float = 0.0,
+    ):
+        self.category = category
+        self.confidence = confidence
+        self.method = method
+        self.cached = cached
+        self.timestamp = timestamp if timestamp != 0.0 else time.time()
 
 
 class LRUCache:
@@ -180,6 +183,17 @@ class ContentClassifier:
         "other": [],
     }
     
+    # 单文件种子名称的扩展名 -> 分类，只收录含义明确的扩展名
+    # （视频容器、.iso 等可能属于多个分类，仍交给关键词规则判断）
+    EXTENSION_CATEGORIES: Dict[str, str] = {
+        ".flac": "music", ".mp3": "music", ".ape": "music", ".m4a": "music",
+        ".epub": "books", ".mobi": "books", ".azw3": "books", ".pdf": "books",
+        ".exe": "software", ".msi": "software", ".dmg": "software", ".apk": "software",
+    }
+    
+    # 扩展名快速分类的置信度，高于直接采用规则结果的阈值
+    EXTENSION_CONFIDENCE = 0.9
+    
     def __init__(self, config: Config, cache_size: int = 1000):
         self.config = config
         self.ai_config = config.ai
@@ -200,27 +214,42 @@ class ContentClassifier:
         # 初始化 LRU 缓存
         self.cache = LRUCache(capacity=cache_size)
         
-        # 合并默认关键词和配置关键词
+        # 合并默认关键词和配置关键词，并预编译正则（关键词在实例生命周期内不变）
         self._keywords = self._build_keywords()
+        self._keyword_patterns = self._build_keyword_patterns()
+        # AI 返回文本的分类匹配顺序：长名称优先，避免自定义分类名
+        # 是另一分类名子串时被先匹配（字典顺序不代表优先级）
+        self._ai_category_order = tuple(sorted(self._keywords, key=len, reverse=True))
         
         # 批量分类的并发限制
         self._semaphore = asyncio.Semaphore(5)
+        
+        # 最近一次 AI 调用成功/失败的时间（time.monotonic），供健康状态查询
+        self._last_ai_success: float = 0.0
+        self._last_ai_failure: float = 0.0
     
     def _build_keywords(self) -> Dict[str, List[str]]:
-        """构建合并后的关键词库"""
-        keywords = dict(self.DEFAULT_KEYWORDS)
+        """构建合并后的关键词库
+        
+        每个分类单次遍历完成合并去重：列表逐分类复制，
+        不会把配置关键词追加进类级别的 DEFAULT_KEYWORDS。
+        """
+        keywords = {
+            cat_name: list(kws) for cat_name, kws in self.DEFAULT_KEYWORDS.items()
+        }
         
         # 合并配置中的关键词
         for cat_name, cat_config in self.config.categories.items():
-            if cat_config.keywords:
-                if cat_name in keywords:
-                    # 合并并去重
-                    existing = set(k.lower() for k in keywords[cat_name])
-                    for kw in cat_config.keywords:
-                        if kw.lower() not in existing:
-                            keywords[cat_name].append(kw)
-                else:
-                    keywords[cat_name] = list(cat_config.keywords)
+            if not cat_config.keywords:
+                continue
+            merged = keywords.setdefault(cat_name, [])
+            # 合并并去重（忽略大小写，配置内部的重复项也一并去掉）
+            seen = {k.lower() for k in merged}
+            for kw in cat_config.keywords:
+                kw_lower = kw.lower()
+                if kw_lower not in seen:
+                    seen.add(kw_lower)
+                    merged.append(kw)
         
         return keywords
     
@@ -231,19 +260,23 @@ class ContentClassifier:
             if cat_name == "other" or not keywords:
                 continue
             
+            # 匹配对象是已转小写的名称：关键词预先转小写并去重，
+            # 无需 IGNORECASE（忽略大小写匹配会让正则引擎慢数倍）
             # 按长度排序，优先匹配长关键词
-            sorted_kws = sorted(keywords, key=len, reverse=True)
+            sorted_kws = sorted({kw.lower() for kw in keywords}, key=len, reverse=True)
             # 转义并合并为正则
-            pattern = re.compile(
-                '|'.join(re.escape(kw) for kw in sorted_kws),
-                re.IGNORECASE
-            )
+            pattern = re.compile('|'.join(re.escape(kw) for kw in sorted_kws))
             patterns[cat_name] = pattern
         return patterns
     
     def _get_cache_key(self, name: str) -> str:
         """生成缓存键 - 使用 MD5 优化性能"""
-        return hashlib.md5(name.lower().strip().encode()).hexdigest()
+        return self._normalized_cache_key(name.lower().strip())
+    
+    @staticmethod
+    def _normalized_cache_key(name_lower: str) -> str:
+        """根据已规范化（小写、去空白）的名称生成缓存键"""
+        return hashlib.md5(name_lower.encode()).hexdigest()
     
     def _calculate_rule_confidence(self, name: str, category: str, matched_count: int = 1) -> float:
         """计算规则分类的置信度 - 优化版"""
@@ -265,28 +298,55 @@ class ContentClassifier:
         
         return min(base_confidence + ratio_bonus, 0.95)
     
-    def _rule_classify(self, name: str) -> Optional[ClassificationResult]:
+    def _extension_classify(self, name_lower: str) -> Optional[ClassificationResult]:
+        """按文件扩展名快速分类
+        
+        单个磁力链接的 dn 常常就是文件名，扩展名足以确定分类：
+        一次 rfind 加一次字典查找，无需运行关键词正则。
+        
+        Args:
+            name_lower: 已转为小写的名称
+        """
+        dot = name_lower.rfind('.')
+        if dot < 0:
+            return None
+        category = self.EXTENSION_CATEGORIES.get(name_lower[dot:])
+        if category is None:
+            return None
+        return ClassificationResult(
+            category=category,
+            confidence=self.EXTENSION_CONFIDENCE,
+            method="rule"
+        )
+    
+    def _rule_classify(
+        self,
+        name: str,
+        name_lower: Optional[str] = None
+    ) -> Optional[ClassificationResult]:
         """规则分类 - 性能优化版
         
         使用预编译正则表达式，时间复杂度从 O(n*m) 优化到 O(n)
         返回包含置信度的分类结果
+        
+        Args:
+            name: 内容名称
+            name_lower: 已转为小写的名称，调用方已计算时传入以免重复转换
         """
         if not name:
             return None
         
-        name_lower = name.lower()
+        if name_lower is None:
+            name_lower = name.lower()
         best_match: Optional[Tuple[str, float]] = None
         
-        # 使用预编译的正则模式进行快速匹配
-        if not hasattr(self, '_keyword_patterns'):
-            self._keyword_patterns = self._build_keyword_patterns()
-        
+        # 使用预编译的正则模式进行快速匹配（只需匹配次数，findall 不构造 Match 对象）
         for cat_name, pattern in self._keyword_patterns.items():
-            matches = list(pattern.finditer(name_lower))
-            if matches:
+            match_count = len(pattern.findall(name_lower))
+            if match_count:
                 # 计算置信度
                 confidence = self._calculate_rule_confidence(
-                    name, cat_name, len(matches)
+                    name, cat_name, match_count
                 )
                 if best_match is None or confidence > best_match[1]:
                     best_match = (cat_name, confidence)
@@ -328,27 +388,31 @@ class ContentClassifier:
                 ],
                 temperature=0.3,
                 max_tokens=20,
+                # 请求级超时：wait_for 超时后工作线程也会随之退出，不会长期占用线程池
+                timeout=timeout,
             )
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(None, _call), 
-                timeout=timeout
-            )
+            response = await asyncio.wait_for(asyncio.to_thread(_call), timeout=timeout)
+            self._last_ai_success = time.monotonic()
             # Anthropic API 响应格式: response.content[0].text
             result_text = response.content[0].text.strip().lower()
             
-            # 验证结果并返回
-            valid_categories = list(self._keywords.keys())
-            for cat in valid_categories:
-                if cat in result_text:
-                    # AI 分类的基础置信度较高
-                    return ClassificationResult(
-                        category=cat,
-                        confidence=0.85,
-                        method="ai"
-                    )
+            # 验证结果并返回：通常 AI 只返回分类名本身，先做精确匹配
+            if result_text in self._keywords:
+                matched = result_text
+            else:
+                matched = next(
+                    (cat for cat in self._ai_category_order if cat in result_text),
+                    None
+                )
+            if matched is not None:
+                # AI 分类的基础置信度较高
+                return ClassificationResult(
+                    category=matched,
+                    confidence=0.85,
+                    method="ai"
+                )
             
             # 如果 AI 返回了无法识别的分类，返回 other
             logger.warning(f"AI 返回了无法识别的分类: {result_text}")
@@ -359,9 +423,11 @@ class ContentClassifier:
             )
             
         except asyncio.TimeoutError:
+            self._last_ai_failure = time.monotonic()
             logger.warning(f"AI 分类超时 ({timeout}s): {name[:50]}...")
             raise
         except Exception as e:
+            self._last_ai_failure = time.monotonic()
             logger.warning(f"AI 分类失败: {e}")
             raise
     
@@ -388,23 +454,31 @@ class ContentClassifier:
                 method="fallback"
             )
         
+        # 只规范化一次，缓存键和规则匹配共用
         name = name.strip()
-        cache_key = self._get_cache_key(name)
+        name_lower = name.lower()
+        cache_key = self._normalized_cache_key(name_lower)
         
         # 检查缓存
         if use_cache:
             cached = self.cache.get(cache_key)
             if cached:
-                logger.debug(f"缓存命中: {name[:50]}... -> {cached.category}")
+                logger.debug("缓存命中: %s... -> %s", name[:50], cached.category)
                 return cached
         
-        # 规则分类
-        rule_result = self._rule_classify(name)
+        # 规则分类：扩展名明确时直接采用，否则走关键词匹配
+        rule_result = (
+            self._extension_classify(name_lower)
+            or self._rule_classify(name, name_lower)
+        )
         if rule_result and rule_result.confidence >= 0.7:
             # 高置信度规则匹配，直接使用
             if use_cache:
                 self.cache.put(cache_key, rule_result)
-            logger.debug(f"规则分类: {name[:50]}... -> {rule_result.category} ({rule_result.confidence:.2f})")
+            logger.debug(
+                "规则分类: %s... -> %s (%.2f)",
+                name[:50], rule_result.category, rule_result.confidence
+            )
             return rule_result
         
         # 尝试 AI 分类
@@ -466,6 +540,12 @@ class ContentClassifier:
         if not names:
             return []
         
+        # 规范化后相同的名称只分类一次（缓存键同样基于规范化名称），
+        # 避免并发执行时对同一内容重复发起 AI 请求
+        unique_names: Dict[str, str] = {}
+        for name in names:
+            unique_names.setdefault((name or "").strip().lower(), name)
+        
         # 创建信号量限制并发
         semaphore = asyncio.Semaphore(max_concurrent)
         
@@ -474,23 +554,51 @@ class ContentClassifier:
                 return await self.classify(name, use_cache=use_cache, timeout=timeout)
         
         # 并发执行所有分类任务
-        tasks = [_classify_one(name) for name in names]
+        tasks = [_classify_one(name) for name in unique_names.values()]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # 处理异常
-        final_results: List[ClassificationResult] = []
-        for i, result in enumerate(results):
+        results_by_key: Dict[str, ClassificationResult] = {}
+        for key, name, result in zip(unique_names, unique_names.values(), results):
             if isinstance(result, Exception):
-                logger.error(f"分类失败 '{names[i][:50]}...': {result}")
-                final_results.append(ClassificationResult(
+                logger.error(f"分类失败 '{name[:50]}...': {result}")
+                result = ClassificationResult(
                     category="other",
                     confidence=0.0,
                     method="fallback"
-                ))
-            else:
-                final_results.append(result)
+                )
+            results_by_key[key] = result
+        
+        return [results_by_key[(name or "").strip().lower()] for name in names]
+    
+    def get_ai_status(self) -> Dict[str, Any]:
+        """获取 AI 分类的健康状态
         
-        return final_results
+        只根据最近的调用记录判断，不会发起额外的 API 请求。
+        
+        Returns:
+            包含 status（disabled/unknown/healthy/degraded）及最近成功、
+            失败距今秒数的字典
+        """
+        if not (self.client and self.ai_config.enabled):
+            return {"status": "disabled", "last_success_age": None, "last_failure_age": None}
+        
+        now = time.monotonic()
+        success_age = now - self._last_ai_success if self._last_ai_success else None
+        failure_age = now - self._last_ai_failure if self._last_ai_failure else None
+        
+        if success_age is None and failure_age is None:
+            status = "unknown"
+        elif failure_age is not None and (success_age is None or failure_age < success_age):
+            status = "degraded"
+        else:
+            status = "healthy"
+        
+        return {
+            "status": status,
+            "last_success_age": success_age,
+            "last_failure_age": failure_age,
+        }
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """获取缓存统计信息"""
@@ -7,7 +7,6 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
 import re
 from collections import OrderedDict
@@ -151,7 +150,6 @@ class ClipboardMonitor(BaseClipboardMonitor):
         # 运行状态
         self._running = False
         self._last_content: str = ""
-        self._last_content_hash: str = ""
         self._last_change_time: float = 0.0
         self._change_count_in_window: int = 0
         self._window_start_time: float = 0.0
@@ -269,16 +267,8 @@ class ClipboardMonitor(BaseClipboardMonitor):
             if current == self._last_content:
                 return
             
-            # 计算内容哈希
-            content_hash = hashlib.md5(current.encode('utf-8')).hexdigest()
-            
-            if content_hash == self._last_content_hash:
-                self._last_content = current
-                return
-            
             # 更新状态
             self._last_content = current
-            self._last_content_hash = content_hash
             self._update_activity_tracking()
             
             # 处理内容
@@ -329,7 +319,7 @@ class ClipboardMonitor(BaseClipboardMonitor):
         
         # 已处理检查
         if magnet_hash in self._processed:
-            logger.debug(f"磁力链接已处理过，跳过: {magnet[:50]}...")
+            logger.debug("磁力链接已处理过，跳过: %s...", magnet[:50])
             self.stats.duplicates_skipped += 1
             return
         
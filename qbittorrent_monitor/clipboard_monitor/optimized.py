@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
 
 from .core import ClipboardMonitor, MagnetExtractor, PacingConfig
 from .activity_tracker import ActivityTracker
@@ -32,15 +33,19 @@ class AdvancedStats:
     checks_performed: int = 0
     clipboard_changes: int = 0
     avg_check_time_ms: float = 0.0
-    _check_times: List[float] = field(default_factory=list)
+    _check_times: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    # 窗口内的累计耗时，用于 O(1) 更新平均值
+    _check_time_sum: float = field(default=0.0, init=False, repr=False)
     
     def record_check_time(self, duration_ms: float) -> None:
         """记录单次检查耗时"""
-        self._check_times.append(duration_ms)
-        # 保持最近100次
-        if len(self._check_times) > 100:
-            self._check_times = self._check_times[-100:]
-        self.avg_check_time_ms = sum(self._check_times) / len(self._check_times)
+        # deque(maxlen=100) 自动丢弃最旧记录，保持最近100次
+        check_times = self._check_times
+        if len(check_times) == check_times.maxlen:
+            self._check_time_sum -= check_times[0]
+        check_times.append(duration_ms)
+        self._check_time_sum += duration_ms
+        self.avg_check_time_ms = self._check_time_sum / len(check_times)
     
     @property
     def checks_per_minute(self) -> float:
@@ -223,17 +228,8 @@ class OptimizedClipboardMonitor(ClipboardMonitor):
             if current == self._last_content:
                 return
             
-            # 计算内容哈希
-            import hashlib
-            content_hash = hashlib.md5(current.encode('utf-8')).hexdigest()
-            
-            if content_hash == self._last_content_hash:
-                self._last_content = current
-                return
-            
             # 更新状态
             self._last_content = current
-            self._last_content_hash = content_hash
             self._update_activity_tracking()
             self.advanced_stats.clipboard_changes += 1
             
@@ -40,6 +40,15 @@ DEFAULT_MAX_DELAY = 60.0
 DEFAULT_EXPONENTIAL_BASE = 2.0
 DEFAULT_JITTER = 0.2
 
+# 编程错误类异常：重试不可能成功，retry_on 未显式包含时直接抛出
+NON_RETRYABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    TypeError,
+    AttributeError,
+    NameError,
+    NotImplementedError,
+    AssertionError,
+)
+
 
 def safe_operation(
     error_message: str = "操作失败",
@@ -181,10 +190,11 @@ def retry_with_backoff(
     retry_on: Optional[Tuple[Type[Exception], ...]] = None,
     on_retry: Optional[Callable[[Exception, int, float], None]] = None,
     on_give_up: Optional[Callable[[Exception], None]] = None,
+    fail_fast_on_repeat: bool = False,
 ) -> Callable[[F], F]:
     """指数退避重试装饰器
     
-    支持抖动（jitter）的指数退避重试机制。
+    支持抖动（jitter）的指数退避重试机制。最后一次尝试失败后不再等待。
     
     Args:
         max_retries: 最大重试次数
@@ -192,9 +202,12 @@ def retry_with_backoff(
         max_delay: 最大延迟（秒）
         exponential_base: 指数基数
         jitter: 抖动比例（0.0-1.0）
-        retry_on: 需要重试的异常类型，None 表示所有异常
+        retry_on: 需要重试的异常类型，None 表示除 NON_RETRYABLE_EXCEPTIONS
+            （TypeError 等编程错误）以外的所有异常
         on_retry: 重试回调函数，参数为 (异常, 重试次数, 延迟时间)
         on_give_up: 放弃重试时的回调函数
+        fail_fast_on_repeat: 连续两次抛出相同异常（类型与参数一致）时立即放弃，
+            避免对确定性失败继续退避等待
     
     Returns:
         装饰后的异步函数
@@ -206,11 +219,22 @@ def retry_with_backoff(
         ...     pass
     """
     def decorator(func: F) -> F:
+        # 装饰时预先计算不变量，重试循环中只访问局部变量
+        func_name = func.__name__
+        total_attempts = max_retries + 1
+        base_delays = [
+            min(base_delay * (exponential_base ** attempt), max_delay)
+            for attempt in range(max_retries)
+        ]
+        
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception: Optional[Exception] = None
+            last_signature: Optional[Tuple[Any, ...]] = None
+            sleep = asyncio.sleep
+            uniform = random.uniform
             
-            for attempt in range(max_retries + 1):
+            for attempt in range(total_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except asyncio.CancelledError:
@@ -220,20 +244,28 @@ def retry_with_backoff(
                     last_exception = e
                     
                     # 检查是否需要重试
-                    if retry_on and not isinstance(e, retry_on):
+                    if retry_on:
+                        if not isinstance(e, retry_on):
+                            raise
+                    elif isinstance(e, NON_RETRYABLE_EXCEPTIONS):
+                        logger.error("%s 发生不可重试的错误: %s", func_name, e)
                         raise
                     
-                    if attempt < max_retries:
-                        # 计算指数退避延迟
-                        delay = min(
-                            base_delay * (exponential_base ** attempt),
-                            max_delay
-                        )
+                    # 连续相同的错误说明重试无望，直接放弃
+                    repeated = False
+                    if fail_fast_on_repeat:
+                        signature = (type(e), e.args)
+                        repeated = signature == last_signature
+                        last_signature = signature
+                    
+                    if attempt < max_retries and not repeated:
+                        # 指数退避延迟
+                        delay = base_delays[attempt]
                         
                         # 添加抖动
                         if jitter > 0:
                             jitter_amount = delay * jitter
-                            delay += random.uniform(-jitter_amount, jitter_amount)
+                            delay += uniform(-jitter_amount, jitter_amount)
                             delay = max(0, delay)  # 确保非负
                         
                         # 执行重试回调
@@ -243,17 +275,17 @@ def retry_with_backoff(
                             except Exception:
                                 pass
                         
-                        # 记录重试日志
+                        # 记录重试日志（惰性格式化，级别被过滤时不拼接字符串）
                         logger.warning(
-                            f"{func.__name__} 第 {attempt + 1}/{max_retries + 1} 次尝试失败，"
-                            f"{delay:.2f}秒后重试: {str(e)}"
+                            "%s 第 %d/%d 次尝试失败，%.2f秒后重试: %s",
+                            func_name, attempt + 1, total_attempts, delay, e
                         )
                         
-                        await asyncio.sleep(delay)
+                        await sleep(delay)
                     else:
-                        # 重试耗尽
+                        # 重试耗尽或重复错误
                         logger.error(
-                            f"{func.__name__} 在 {max_retries + 1} 次尝试后仍然失败: {str(e)}"
+                            "%s 在 %d 次尝试后仍然失败: %s", func_name, attempt + 1, e
                         )
                         
                         if on_give_up:
@@ -261,6 +293,7 @@ def retry_with_backoff(
                                 on_give_up(e)
                             except Exception:
                                 pass
+                        break
             
             # 重试耗尽后抛出最后的异常
             if last_exception:
@@ -293,11 +326,11 @@ def log_execution_time(
     def decorator(func: F) -> F:
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 return await func(*args, **kwargs)
             finally:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if elapsed >= min_time:
                     log_msg = message.format(
                         func_name=func.__name__,
@@ -307,11 +340,11 @@ def log_execution_time(
         
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 return func(*args, **kwargs)
             finally:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if elapsed >= min_time:
                     log_msg = message.format(
                         func_name=func.__name__,
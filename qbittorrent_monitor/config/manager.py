@@ -75,9 +75,16 @@ class ConfigManager:
             (self.auto_reload and current_time - self._last_check > self.reload_interval)
         )
         
-        if need_reload and self.config_path.exists():
+        # 只做一次 stat()：文件不存在时直接得到异常，无需先调用 exists()
+        current_modified: Optional[float] = None
+        if need_reload:
+            try:
+                current_modified = self.config_path.stat().st_mtime
+            except OSError:
+                pass
+        
+        if current_modified is not None:
             self._last_check = current_time
-            current_modified = self.config_path.stat().st_mtime
             
             if force_reload or self._config is None or current_modified > self._last_modified:
                 logger.info("检测到配置文件变更，正在重新加载...")
@@ -22,6 +22,7 @@ class DebounceService:
     """防抖服务
     
     使用堆优化过期清理，时间复杂度从 O(n) 降到 O(log n)。
+    条目数不超过 ``max_size``，超出时淘汰最早的记录，内存与输入流长度无关。
     """
     
     def __init__(
@@ -62,14 +63,30 @@ class DebounceService:
         expire_time = now + self.debounce_seconds * self.cleanup_multiplier
         heapq.heappush(self._heap, DebounceEntry(expire_time, magnet_hash))
         
+        # 超出容量时淘汰最早的记录
+        while len(self._entries) > self.max_size:
+            self._pop_oldest()
+        
         return False
     
+    def _pop_oldest(self) -> None:
+        """弹出堆顶条目，仅当它仍是该 hash 的最新记录时才删除"""
+        entry = heapq.heappop(self._heap)
+        last_seen = self._entries.get(entry.magnet_hash)
+        if (
+            last_seen is not None
+            and last_seen + self.debounce_seconds * self.cleanup_multiplier
+            <= entry.expire_time
+        ):
+            del self._entries[entry.magnet_hash]
+    
     def _cleanup_expired(self, now: float) -> None:
-        """清理过期的防抖记录"""
+        """清理过期的防抖记录
+        
+        同一 hash 重新出现时会压入新的堆条目，旧条目到期时不会误删新记录。
+        """
         while self._heap and self._heap[0].expire_time <= now:
-            entry = heapq.heappop(self._heap)
-            if entry.magnet_hash in self._entries:
-                del self._entries[entry.magnet_hash]
+            self._pop_oldest()
     
     def clear(self) -> None:
         """清空所有防抖记录"""
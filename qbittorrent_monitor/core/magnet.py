@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import re
 import urllib.parse
-from typing import Optional, List, NamedTuple
+from typing import Dict, Optional, List, NamedTuple
 from dataclasses import dataclass
 
 from ..security import validate_magnet, sanitize_magnet
@@ -120,14 +120,8 @@ class MagnetProcessor:
         Returns:
             种子名称，无效时返回None
         """
-        try:
-            parsed = urllib.parse.urlparse(magnet)
-            params = urllib.parse.parse_qs(parsed.query)
-            if "dn" in params:
-                return params["dn"][0]
-        except Exception:
-            pass
-        return None
+        names = self._parse_params(magnet).get("dn")
+        return names[0] if names else None
     
     def parse(self, magnet: str) -> Optional[MagnetInfo]:
         """完整解析磁力链接
@@ -146,21 +140,35 @@ class MagnetProcessor:
         if not magnet_hash:
             return None
         
+        # 查询参数只解析一次，名称和 tracker 共用
+        params = self._parse_params(magnet)
+        names = params.get("dn")
+        
         return MagnetInfo(
             raw=magnet,
             hash=magnet_hash,
-            name=self.get_name(magnet),
-            trackers=self._get_trackers(magnet)
+            name=names[0] if names else None,
+            trackers=params.get("tr", [])
         )
     
-    def _get_trackers(self, magnet: str) -> List[str]:
-        """获取tracker列表"""
+    @staticmethod
+    def _parse_params(magnet: str) -> Dict[str, List[str]]:
+        """一次性解析磁力链接的查询参数
+        
+        Args:
+            magnet: 磁力链接
+            
+        Returns:
+            参数名到参数值列表的映射，解析失败返回空字典
+        """
         try:
-            parsed = urllib.parse.urlparse(magnet)
-            params = urllib.parse.parse_qs(parsed.query)
-            return params.get("tr", [])
+            return urllib.parse.parse_qs(urllib.parse.urlparse(magnet).query)
         except Exception:
-            return []
+            return {}
+    
+    def _get_trackers(self, magnet: str) -> List[str]:
+        """获取tracker列表"""
+        return self._parse_params(magnet).get("tr", [])
     
     def get_display_name(self, magnet: str, max_length: int = 100) -> str:
         """获取显示名称（用于日志）
@@ -14,10 +14,11 @@ import logging
 import logging.handlers
 import sys
 import os
+import time
 from pathlib import Path
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Union, TextIO
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 from .logging_filters import SensitiveDataFilter
@@ -60,8 +61,20 @@ class LogConfig:
     debug_separate: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        return asdict(self)
+        """转换为字典（字段均为标量，无需 asdict 的递归深拷贝）"""
+        return {
+            "level": self.level,
+            "format": self.format,
+            "console_enabled": self.console_enabled,
+            "console_color": self.console_color,
+            "file_enabled": self.file_enabled,
+            "file_path": self.file_path,
+            "file_max_bytes": self.file_max_bytes,
+            "file_backup_count": self.file_backup_count,
+            "file_max_age_days": self.file_max_age_days,
+            "separate_levels": self.separate_levels,
+            "debug_separate": self.debug_separate,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LogConfig":
@@ -142,11 +155,25 @@ class JsonFormatter(logging.Formatter):
         self.include_stack_info = include_stack_info
         self._hostname = os.uname().nodename if hasattr(os, "uname") else "unknown"
         self._project_name = "qb-monitor"
+        # (秒, 已格式化的秒级前缀)，整体替换以保证多线程下读取一致
+        self._cached_second = (-1, "")
+    
+    def _format_timestamp(self, created: float) -> str:
+        """将记录创建时间格式化为 UTC ISO 8601 时间戳
+        
+        同一秒内的记录复用已格式化的秒级前缀，只拼接微秒部分。
+        """
+        second = int(created)
+        cached_second, prefix = self._cached_second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
     
     def format(self, record: logging.LogRecord) -> str:
         """将日志记录格式化为 JSON"""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -250,6 +277,28 @@ class TimeAndSizeRotatingHandler(logging.handlers.RotatingFileHandler):
         self.base_filename = Path(filename)
         self._cleanup_old_logs()
     
+    def _open(self):
+        """打开日志文件，并记录其是否为普通文件"""
+        stream = super()._open()
+        # 每次（重新）打开时判断一次，轮转检查不再逐条记录 stat
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """判断是否需要轮转
+        
+        标准实现每条记录都会对日志路径调用 exists/isfile 两次 stat，
+        这里复用打开文件时的判断结果，只保留大小检查。
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        # 与标准实现一致：非普通文件（如 /dev/null）从不轮转
+        if not self._is_regular_file or self.maxBytes <= 0:
+            return False
+        msg = "%s\n" % self.format(record)
+        self.stream.seek(0, 2)
+        return self.stream.tell() + len(msg) >= self.maxBytes
+    
     def doRollover(self):
         """执行日志轮转"""
         super().doRollover()
@@ -8,7 +8,6 @@ import re
 import logging
 import logging.handlers
 import hashlib
-import secrets
 import time
 from typing import Pattern, List, Tuple, Optional, Any, Union, Dict, Set
 from pathlib import Path
@@ -74,6 +74,15 @@ class SensitiveDataFilter(logging.Filter):
         (re.compile(r'(https?://)([^:]+):([^@]+)@', re.IGNORECASE), r'\1\2:***@'),
     ]
     
+    # 每条 SENSITIVE_PATTERNS 都至少包含下列字面量之一（忽略大小写）。
+    # 合并为一个正则做单次预扫描：绝大多数日志不含敏感信息，
+    # 未命中时直接跳过逐条替换，无需对消息扫描二十多遍
+    SENSITIVE_TRIGGER: Pattern[str] = re.compile(
+        r'api|sk-|passw|pwd|token|bearer|btih:|private|secret|://'
+        r'|sid|session|auth|username|ssh-',
+        re.IGNORECASE,
+    )
+    
     # 需要完全过滤的字段名
     SENSITIVE_KEYS: set[str] = {
         'password', 'passwd', 'pwd', 'secret', 'api_key', 'apikey',
@@ -97,6 +106,11 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             True（始终通过，但内容可能被修改）
         """
+        # 同一条记录会依次经过记录器、各处理器和 RedactingFormatter 上的过滤器，
+        # 已按同一模式集脱敏过的记录直接放行，避免重复执行正则
+        if getattr(record, "_redacted_patterns", None) is self.patterns:
+            return True
+        
         # 安全处理：先格式化再过滤
         if record.args:
             # 尝试安全格式化
@@ -139,6 +153,7 @@ class SensitiveDataFilter(logging.Filter):
                 except Exception:
                     pass  # 如果无法创建新异常，保留原始异常
         
+        record._redacted_patterns = self.patterns
         return True
     
     def _filter_sensitive_data(self, text: Any) -> Any:
@@ -154,6 +169,10 @@ class SensitiveDataFilter(logging.Filter):
         if not isinstance(text, str):
             return text
         
+        # 默认模式集下先做单次预扫描，不含任何触发词时原样返回
+        if self.patterns is self.SENSITIVE_PATTERNS and not self.SENSITIVE_TRIGGER.search(text):
+            return text
+        
         filtered_text: str = text
         for pattern, replacement in self.patterns:
             filtered_text = pattern.sub(replacement, filtered_text)
@@ -441,11 +441,11 @@ def timed_clipboard_check():
         yield
         return
     
-    start = time.time()
+    start = time.perf_counter()
     try:
         yield
     finally:
-        collector.clipboard_check_duration_seconds.observe(time.time() - start)
+        collector.clipboard_check_duration_seconds.observe(time.perf_counter() - start)
 
 
 @contextmanager
@@ -456,11 +456,11 @@ def timed_torrent_add():
         yield
         return
     
-    start = time.time()
+    start = time.perf_counter()
     try:
         yield
     finally:
-        collector.torrent_add_duration_seconds.observe(time.time() - start)
+        collector.torrent_add_duration_seconds.observe(time.perf_counter() - start)
 
 
 @contextmanager
@@ -471,11 +471,11 @@ def timed_classification():
         yield
         return
     
-    start = time.time()
+    start = time.perf_counter()
     try:
         yield
     finally:
-        collector.classify_duration_seconds.observe(time.time() - start)
+        collector.classify_duration_seconds.observe(time.perf_counter() - start)
 
 
 @contextmanager
@@ -490,12 +490,12 @@ def timed_api_call(endpoint: str):
         yield
         return
     
-    start = time.time()
+    start = time.perf_counter()
     try:
         yield
     finally:
         collector.api_call_duration_seconds.labels(endpoint=endpoint).observe(
-            time.time() - start
+            time.perf_counter() - start
         )
 
 
@@ -5,14 +5,13 @@
 
 import asyncio
 import logging
-from typing import Optional
-from urllib.parse import urlparse
+import time
+from typing import Awaitable, Callable, Dict, Optional
 
 from .metrics import (
     get_metrics_collector,
     init_metrics,
     MetricsCollector,
-    CONTENT_TYPE_LATEST,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,6 +23,26 @@ class MetricsServer:
     提供 /metrics 端点供 Prometheus 抓取指标。
     """
     
+    # 健康检查响应内容固定，预先生成完整响应字节
+    _HEALTH_BODY = b'{"status": "healthy"}'
+    _HEALTH_RESPONSE = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n"
+        b"Connection: close\r\n"
+        b"\r\n" % len(_HEALTH_BODY)
+    ) + _HEALTH_BODY
+    
+    # 存活探针响应的固定部分，每次请求只拼接运行时长
+    _LIVE_HEADER_PREFIX = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Connection: close\r\n"
+        b"Content-Length: "
+    )
+    _LIVE_BODY_PREFIX = b'{"alive":true,"uptime":'
+    _LIVE_REQUEST_PREFIX = b"GET /health/live "
+    
     def __init__(
         self,
         host: str = "0.0.0.0",
@@ -47,6 +66,19 @@ class MetricsServer:
         self._server: Optional[asyncio.AbstractServer] = None
         self._running = False
         self._metrics_collector: Optional[MetricsCollector] = None
+        
+        self._start_time = time.monotonic()
+        
+        # GET 路由表：路径 -> 响应函数
+        self._get_routes: Dict[str, Callable[[asyncio.StreamWriter], Awaitable[None]]] = {
+            self.path: self._send_metrics_response,
+            "/health/live": self._send_liveness_response,
+            "/health": self._send_health_response,
+            "/": self._send_index_response,
+        }
+        
+        # 索引页内容只依赖服务器配置，构造时渲染一次
+        self._index_response = self._render_index()
     
     async def start(self) -> None:
         """启动指标服务器"""
@@ -64,6 +96,7 @@ class MetricsServer:
                 self.port,
             )
             self._running = True
+            self._start_time = time.monotonic()
             
             addr = self._server.sockets[0].getsockname()
             logger.info(f"Prometheus 指标服务器已启动: http://{addr[0]}:{addr[1]}{self.path}")
@@ -94,11 +127,21 @@ class MetricsServer:
         """
         try:
             # 读取请求行
-            request_line = await reader.readline()
-            request_line = request_line.decode("utf-8").strip()
+            raw_line = await reader.readline()
             
-            # 解析请求
-            method, path, _ = self._parse_request_line(request_line)
+            # 存活探针是最高频的请求，直接匹配原始字节，跳过解码与解析
+            if raw_line.startswith(self._LIVE_REQUEST_PREFIX):
+                handler = self._send_liveness_response
+            else:
+                request_line = raw_line.decode("utf-8").strip()
+                
+                # 解析请求
+                method, path, _ = self._parse_request_line(request_line)
+                handler = None
+                if method == "GET":
+                    handler = self._get_routes.get(path)
+                if handler is None:
+                    handler = self._send_404_response
             
             # 读取并丢弃请求头
             while True:
@@ -107,14 +150,7 @@ class MetricsServer:
                     break
             
             # 处理请求
-            if method == "GET" and path == self.path:
-                await self._send_metrics_response(writer)
-            elif method == "GET" and path == "/health":
-                await self._send_health_response(writer)
-            elif method == "GET" and path == "/":
-                await self._send_index_response(writer)
-            else:
-                await self._send_404_response(writer)
+            await handler(writer)
                 
         except Exception as e:
             logger.error(f"处理指标请求失败: {e}")
@@ -179,17 +215,22 @@ class MetricsServer:
         Args:
             writer: 流写入器
         """
-        body = b'{"status": "healthy"}'
-        header = (
-            f"HTTP/1.1 200 OK\r\n"
-            f"Content-Type: application/json\r\n"
-            f"Content-Length: {len(body)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-        ).encode("utf-8")
+        writer.write(self._HEALTH_RESPONSE)
+        await writer.drain()
+    
+    async def _send_liveness_response(self, writer: asyncio.StreamWriter) -> None:
+        """发送存活探针响应
         
-        writer.write(header)
-        writer.write(body)
+        供 Kubernetes livenessProbe 高频轮询，响应模板预先生成，不经过 JSON 编码。
+        
+        Args:
+            writer: 流写入器
+        """
+        body = (
+            self._LIVE_BODY_PREFIX
+            + b"%.3f}" % (time.monotonic() - self._start_time)
+        )
+        writer.write(self._LIVE_HEADER_PREFIX + b"%d\r\n\r\n" % len(body) + body)
         await writer.drain()
     
     async def _send_index_response(self, writer: asyncio.StreamWriter) -> None:
@@ -198,6 +239,11 @@ class MetricsServer:
         Args:
             writer: 流写入器
         """
+        writer.write(self._index_response)
+        await writer.drain()
+    
+    def _render_index(self) -> bytes:
+        """渲染索引页完整响应"""
         html = f"""<!DOCTYPE html>
 <html>
 <head>
@@ -238,6 +284,7 @@ class MetricsServer:
         <ul>
             <li><a href="{self.path}">{self.path}</a> - Prometheus metrics endpoint</li>
             <li><a href="/health">/health</a> - Health check endpoint</li>
+            <li><a href="/health/live">/health/live</a> - Liveness probe endpoint</li>
         </ul>
     </div>
     <div class="card">
@@ -259,10 +306,7 @@ class MetricsServer:
             f"Connection: close\r\n"
             f"\r\n"
         ).encode("utf-8")
-        
-        writer.write(header)
-        writer.write(body)
-        await writer.drain()
+        return header + body
     
     async def _send_404_response(self, writer: asyncio.StreamWriter) -> None:
         """发送 404 响应
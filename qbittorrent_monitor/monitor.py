@@ -8,9 +8,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from typing import Optional, Set, Callable, Dict, List, OrderedDict as OrderedDictType
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Set, Callable, Deque, Dict, List, OrderedDict as OrderedDictType
 from datetime import datetime
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 
 import pyperclip
@@ -62,8 +65,11 @@ class MonitorStats:
     checks_performed: int = 0
     clipboard_changes: int = 0
     hash_cache_hits: int = 0
+    clipboard_timeouts: int = 0
     avg_check_time_ms: float = 0.0
-    _check_times: List[float] = field(default_factory=list)
+    _check_times: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    # 窗口内的累计耗时，用于 O(1) 更新平均值
+    _check_time_sum: float = field(default=0.0, init=False, repr=False)
     
     @property
     def uptime_seconds(self) -> float:
@@ -80,11 +86,13 @@ class MonitorStats:
     
     def record_check_time(self, duration_ms: float) -> None:
         """记录单次检查耗时"""
-        self._check_times.append(duration_ms)
-        # 保持最近100次
-        if len(self._check_times) > 100:
-            self._check_times = self._check_times[-100:]
-        self.avg_check_time_ms = sum(self._check_times) / len(self._check_times)
+        # deque(maxlen=100) 自动丢弃最旧记录，保持最近100次
+        check_times = self._check_times
+        if len(check_times) == check_times.maxlen:
+            self._check_time_sum -= check_times[0]
+        check_times.append(duration_ms)
+        self._check_time_sum += duration_ms
+        self.avg_check_time_ms = self._check_time_sum / len(check_times)
     
     def to_dict(self) -> Dict:
         """导出统计信息为字典"""
@@ -127,6 +135,10 @@ class MagnetExtractor:
     )
     BTIH_PATTERN = re.compile(r'btih:([a-fA-F0-9]{40}|[a-z2-7]{32})', re.IGNORECASE)
     
+    # btih 固定前缀后的合法字符集（用于切片校验，避免正则）
+    _HEX_CHARS = frozenset('0123456789abcdefABCDEF')
+    _BASE32_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ234567')
+    
     MIN_MAGNET_LENGTH = 50
     MAX_MAGNET_LENGTH = SAFE_LIMITS['max_magnet_length']
     
@@ -143,9 +155,7 @@ class MagnetExtractor:
             content = content[:cls.MAX_MAGNET_LENGTH * 10]
         
         # 快速检查是否包含 magnet: 前缀
-        if 'magnet:?' not in content:
-            if content.startswith('magnet:?'):
-                return cls._validate_and_return(content)
+        if not cls.may_contain_magnet(content):
             return []
         
         # 使用预编译正则快速匹配
@@ -159,7 +169,7 @@ class MagnetExtractor:
             
             is_valid, error = validate_magnet(m)
             if not is_valid:
-                logger.debug(f"跳过无效的磁力链接: {error}")
+                logger.debug("跳过无效的磁力链接: %s", error)
                 continue
             
             magnet_hash = cls._extract_hash(m)
@@ -169,6 +179,15 @@ class MagnetExtractor:
         
         return unique_magnets
     
+    @classmethod
+    def may_contain_magnet(cls, content: str) -> bool:
+        """快速预判内容是否可能包含磁力链接
+        
+        只做长度和字面量子串检查（C 层扫描），不触发任何正则；
+        返回 False 时 ``extract`` 必定返回空列表。
+        """
+        return len(content) >= cls.MIN_MAGNET_LENGTH and 'magnet:?' in content
+    
     @classmethod
     def _validate_and_return(cls, content: str) -> List[str]:
         """验证并返回单个磁力链接"""
@@ -185,7 +204,21 @@ class MagnetExtractor:
     
     @classmethod
     def _extract_hash(cls, magnet: str) -> Optional[str]:
-        """提取磁力链接的 hash"""
+        """提取磁力链接的 hash
+        
+        hash 紧跟在固定前缀 ``btih:`` 之后，直接按固定偏移切片并校验字符集；
+        仅在首个前缀处未命中（如大小写混合或多个 xt）时回退到正则。
+        """
+        i = magnet.find('btih:')
+        if i >= 0:
+            i += 5
+            candidate = magnet[i:i + 40]
+            if len(candidate) == 40 and cls._HEX_CHARS.issuperset(candidate):
+                return candidate.lower()
+            candidate = magnet[i:i + 32]
+            if len(candidate) == 32 and cls._BASE32_CHARS.issuperset(candidate):
+                return candidate.lower()
+        
         match = cls.BTIH_PATTERN.search(magnet)
         return match.group(1).lower() if match else None
 
@@ -234,7 +267,6 @@ class ClipboardMonitor:
         # 运行状态
         self._running = False
         self._last_content: str = ""
-        self._last_content_hash: str = ""
         self._last_change_time: float = 0.0
         self._change_count_in_window: int = 0
         self._window_start_time: float = 0.0
@@ -244,6 +276,11 @@ class ClipboardMonitor:
         
         # 速率限制
         self._max_magnets_per_check = 100
+        
+        # 剪贴板读取专用线程池（懒创建），避免与默认线程池中的其他任务争抢
+        self._clipboard_executor: Optional[ThreadPoolExecutor] = None
+        # 最近一次派发的剪贴板读取，未完成前不再派发新的读取
+        self._clipboard_future: Optional[Future[str]] = None
     
     def add_handler(self, handler: Callable[[str, str], None]) -> None:
         """添加处理回调 - 保持向后兼容"""
@@ -380,7 +417,7 @@ class ClipboardMonitor:
         
         self._running = True
         self.stats.start_time = datetime.now()
-        self._window_start_time = datetime.now().timestamp()
+        self._window_start_time = time.time()
         
         # 记录监控状态指标
         metrics_module.set_monitor_running(True)
@@ -400,19 +437,24 @@ class ClipboardMonitor:
             }
             print_startup_info(config_info)
         else:
-            # Fallback: 标准文本输出
-            print("=" * 50)
-            print("剪贴板监控已启动 (重构版)")
-            print(f"活跃检查间隔: {self.pacing.active_interval}秒")
-            print(f"空闲检查间隔: {self.pacing.idle_interval}秒")
-            print(f"防抖窗口: {self._debounce_filter.debounce_seconds}秒")
-            print(f"最大磁力链接长度: {SAFE_LIMITS['max_magnet_length']} 字符")
-            print("按 Ctrl+C 停止")
-            print("=" * 50)
-        
+            # Fallback: 标准文本输出（拼接后一次写出）
+            lines = [
+                "=" * 50,
+                "剪贴板监控已启动 (重构版)",
+                f"活跃检查间隔: {self.pacing.active_interval}秒",
+                f"空闲检查间隔: {self.pacing.idle_interval}秒",
+                f"防抖窗口: {self._debounce_filter.debounce_seconds}秒",
+                f"最大磁力链接长度: {SAFE_LIMITS['max_magnet_length']} 字符",
+                "按 Ctrl+C 停止",
+                "=" * 50,
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        
+        loop = asyncio.get_running_loop()
         try:
             while self._running:
-                check_start = datetime.now().timestamp()
+                check_start = loop.time()
                 
                 with metrics_module.timed_clipboard_check():
                     await self._check_clipboard()
@@ -420,11 +462,11 @@ class ClipboardMonitor:
                 # 更新指标
                 self._update_metrics()
                 
-                check_duration = (datetime.now().timestamp() - check_start) * 1000
+                check_duration = (loop.time() - check_start) * 1000
                 self.stats.record_check_time(check_duration)
                 
                 # 智能轮询间隔计算
-                interval = self._calculate_interval()
+                interval = self._calculate_interval(time.time())
                 metrics_module.set_clipboard_check_interval(interval)
                 await asyncio.sleep(interval)
                 
@@ -433,6 +475,10 @@ class ClipboardMonitor:
         finally:
             self._running = False
             metrics_module.set_monitor_running(False)
+            if self._clipboard_executor is not None:
+                self._clipboard_executor.shutdown(wait=False, cancel_futures=True)
+                self._clipboard_executor = None
+                self._clipboard_future = None
             # 关闭数据库连接
             if self._db and not self._external_db:
                 try:
@@ -445,9 +491,14 @@ class ClipboardMonitor:
         """停止监控"""
         self._running = False
     
-    def _calculate_interval(self) -> float:
-        """计算智能轮询间隔"""
-        now = datetime.now().timestamp()
+    def _calculate_interval(self, now: Optional[float] = None) -> float:
+        """计算智能轮询间隔
+        
+        Args:
+            now: 当前时间戳，默认取 time.time()
+        """
+        if now is None:
+            now = time.time()
         time_since_last_change = now - self._last_change_time
         
         # 如果在突发窗口内有多次变化，使用活跃间隔
@@ -470,12 +521,27 @@ class ClipboardMonitor:
         self.stats.checks_performed += 1
         
         try:
-            # 异步读取剪贴板
-            loop = asyncio.get_event_loop()
-            current = await asyncio.wait_for(
-                loop.run_in_executor(None, pyperclip.paste),
-                timeout=0.5
-            )
+            # 上次读取仍挂起（如 xclip/pbpaste 卡住）：跳过本次检查，不再堆积线程
+            if self._clipboard_future is not None and not self._clipboard_future.done():
+                self.stats.clipboard_timeouts += 1
+                logger.debug("上次剪贴板读取尚未返回，跳过本次检查")
+                return
+            
+            # 异步读取剪贴板（单线程专用池：超时挂起的读取不会占满默认线程池）
+            if self._clipboard_executor is None:
+                self._clipboard_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="clipboard"
+                )
+            self._clipboard_future = self._clipboard_executor.submit(pyperclip.paste)
+            try:
+                current = await asyncio.wait_for(
+                    asyncio.wrap_future(self._clipboard_future),
+                    timeout=0.5
+                )
+            except asyncio.TimeoutError:
+                # 正在执行的读取无法取消，保留 future，待其返回后再派发新的读取
+                self.stats.clipboard_timeouts += 1
+                raise
             
             if not current:
                 return
@@ -483,17 +549,8 @@ class ClipboardMonitor:
             if current == self._last_content:
                 return
             
-            # 计算内容哈希
-            import hashlib
-            content_hash = hashlib.md5(current.encode('utf-8')).hexdigest()
-            
-            if content_hash == self._last_content_hash:
-                self._last_content = current
-                return
-            
             # 更新状态
             self._last_content = current
-            self._last_content_hash = content_hash
             self._update_activity_tracking()
             self.stats.clipboard_changes += 1
             
@@ -512,9 +569,14 @@ class ClipboardMonitor:
         except Exception as e:
             logger.error(f"检查剪贴板失败: {e}")
     
-    def _update_activity_tracking(self) -> None:
-        """更新活动追踪状态"""
-        now = datetime.now().timestamp()
+    def _update_activity_tracking(self, now: Optional[float] = None) -> None:
+        """更新活动追踪状态
+        
+        Args:
+            now: 当前时间戳，默认取 time.time()
+        """
+        if now is None:
+            now = time.time()
         
         self._last_change_time = now
         
@@ -526,6 +588,11 @@ class ClipboardMonitor:
     
     async def _process_content(self, content: str) -> None:
         """处理剪贴板内容"""
+        # 绝大多数剪贴板内容不含链接：字面量预判直接返回，
+        # 既不跑正则，也不为其计算缓存键、挤占缓存容量
+        if not MagnetExtractor.may_contain_magnet(content):
+            return
+        
         # 使用优化的磁力链接提取
         magnets = MagnetExtractor.extract(content)
         
@@ -542,23 +609,25 @@ class ClipboardMonitor:
             )
             magnets = magnets[:self._max_magnets_per_check]
         
-        # 缓存提取结果
-        cache_key = ",".join(sorted((MagnetExtractor._extract_hash(m) or m) for m in magnets))
-        self._cache.put(content, cache_key)
+        # 缓存提取结果（hash 只提取一次，缓存键和后续处理共用）
+        hashes = [MagnetExtractor._extract_hash(m) or m for m in magnets]
+        self._cache.put(content, ",".join(sorted(hashes)))
         
         logger.info(f"发现 {len(magnets)} 个磁力链接")
         
-        for magnet in magnets:
-            await self._process_magnet(magnet)
+        for magnet, magnet_hash in zip(magnets, hashes):
+            await self._process_magnet(magnet, magnet_hash)
     
-    async def _process_magnet(self, magnet: str) -> None:
-        """处理单个磁力链接 - 使用 DebounceFilter"""
-        self.stats.total_processed += 1
+    async def _process_magnet(self, magnet: str, magnet_hash: Optional[str] = None) -> None:
+        """处理单个磁力链接 - 使用 DebounceFilter
         
-        # 首先解析名称
-        name: str = parse_magnet(magnet) or magnet
+        Args:
+            magnet: 磁力链接
+            magnet_hash: 调用方已提取的 hash，省略时在此提取
+        """
+        self.stats.total_processed += 1
         
-        # 验证磁力链接
+        # 验证磁力链接（只验证一次，后续提取不再重复验证）
         is_valid, error = validate_magnet(magnet)
         if not is_valid:
             logger.warning(f"无效的磁力链接，跳过: {error}")
@@ -568,15 +637,20 @@ class ClipboardMonitor:
             return
         
         # 提取 hash
-        magnet_hash = extract_magnet_hash(magnet) or magnet
+        if magnet_hash is None:
+            magnet_hash = MagnetExtractor._extract_hash(magnet) or magnet
         
         # 防抖检查（使用新的 DebounceFilter）
         if self._debounce_filter.is_debounced(magnet_hash):
-            logger.debug(f"磁力链接在防抖窗口内，跳过: {get_magnet_display_name(magnet)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"磁力链接在防抖窗口内，跳过: {get_magnet_display_name(magnet)}")
             self.stats.duplicates_skipped += 1
             metrics_module.record_duplicate_skipped(reason="debounce")
             return
         
+        # 解析名称（防抖跳过的链接无需解析）
+        name: str = parse_magnet(magnet) or magnet
+        
         # 分类
         with metrics_module.timed_classification():
             classification_result = await self.classifier.classify(name)
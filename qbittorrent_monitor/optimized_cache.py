@@ -1,7 +1,6 @@
 """分层缓存系统 - 多级缓存策略"""
 import sys
 import time
-import weakref
 from typing import Dict, Optional, Generic, TypeVar, Any
 from collections import OrderedDict
 import functools
@@ -1,7 +1,5 @@
 """优化的关键词匹配引擎 - 使用 Aho-Corasick 算法"""
-import time
-from typing import Dict, List, Set, Tuple, Optional
-from collections import deque
+from typing import Dict, List, Tuple, Optional
 
 try:
     import ahocorasick
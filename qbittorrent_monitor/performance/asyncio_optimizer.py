@@ -221,7 +221,8 @@ class TaskManager:
         on_error: Optional[Callable] = None,
     ) -> T:
         """包装协程以处理回调"""
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         try:
             result = await coro
@@ -258,7 +259,7 @@ class TaskManager:
             raise
             
         finally:
-            duration = (time.time() - start_time) * 1000
+            duration = (loop.time() - start_time) * 1000
             self._stats._durations.append(duration)
     
     def _on_task_done(self, task: asyncio.Task) -> None:
@@ -377,10 +378,7 @@ class ConcurrencyLimiter:
         """
         async def _wrapper():
             async with self.acquire():
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(
-                    None, functools.partial(func, *args, **kwargs)
-                )
+                return await asyncio.to_thread(func, *args, **kwargs)
         
         return _wrapper()
     
@@ -503,7 +501,8 @@ class AsyncIOOptimizer:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             name = func.__name__
-            start_time = time.time()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
             
             if name not in self._metrics:
                 self._metrics[name] = CoroutineMetrics(name=name)
@@ -515,7 +514,7 @@ class AsyncIOOptimizer:
                 result = await func(*args, **kwargs)
                 return result
             finally:
-                elapsed_ms = (time.time() - start_time) * 1000
+                elapsed_ms = (loop.time() - start_time) * 1000
                 metrics.total_time_ms += elapsed_ms
                 metrics.avg_time_ms = metrics.total_time_ms / metrics.call_count
                 metrics.max_time_ms = max(metrics.max_time_ms, elapsed_ms)
@@ -588,9 +587,10 @@ class AsyncIOOptimizer:
                 # 已经是协程函数，直接返回
                 @functools.wraps(func)
                 async def async_wrapper(*args, **kwargs):
-                    start = time.time()
+                    loop = asyncio.get_running_loop()
+                    start = loop.time()
                     result = await func(*args, **kwargs)
-                    elapsed_ms = (time.time() - start) * 1000
+                    elapsed_ms = (loop.time() - start) * 1000
                     
                     if elapsed_ms > threshold_ms:
                         logger.warning(
@@ -609,9 +609,9 @@ class AsyncIOOptimizer:
                         f"建议使用 run_in_thread"
                     )
                     
-                    start = time.time()
+                    start = time.perf_counter()
                     result = func(*args, **kwargs)
-                    elapsed_ms = (time.time() - start) * 1000
+                    elapsed_ms = (time.perf_counter() - start) * 1000
                     
                     if elapsed_ms > threshold_ms:
                         logger.warning(
@@ -645,7 +645,10 @@ async def run_in_executor(
     Returns:
         函数返回值
     """
-    loop = asyncio.get_event_loop()
+    if executor is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    
+    loop = asyncio.get_running_loop()
     
     if kwargs:
         func = functools.partial(func, **kwargs)
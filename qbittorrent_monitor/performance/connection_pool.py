@@ -47,16 +47,31 @@ class ConnectionStats:
         return self.reused_connections / total if total > 0 else 0.0
 
 
-@dataclass
 class ConnectionInfo:
     """连接信息"""
-    id: str
-    created_at: float
-    last_used: float
-    request_count: int = 0
-    failed_requests: int = 0
-    is_healthy: bool = True
-    latency_ms: float = 0.0
+    
+    __slots__ = (
+        "id", "created_at", "last_used", "request_count", "failed_requests",
+        "is_healthy", "latency_ms",
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        created_at: float,
+        last_used: float,
+        request_count: int = 0,
+        failed_requests: int = 0,
+        is_healthy: bool = True,
+        latency_ms: float = 0.0,
+    ):
+        self.id = id
+        self.created_at = created_at
+        self.last_used = last_used
+        self.request_count = request_count
+        self.failed_requests = failed_requests
+        self.is_healthy = is_healthy
+        self.latency_ms = latency_ms
 
 
 class ConnectionHealthMonitor:
@@ -79,6 +94,7 @@ class ConnectionHealthMonitor:
         check_interval: float = 30.0,
         timeout: float = 5.0,
         max_failures: int = 3,
+        max_concurrent_probes: int = 2,
     ):
         """初始化健康监控器
         
@@ -86,10 +102,12 @@ class ConnectionHealthMonitor:
             check_interval: 检查间隔（秒）
             timeout: 健康检查超时时间（秒）
             max_failures: 最大连续失败次数
+            max_concurrent_probes: 同时进行的探测请求上限
         """
         self.check_interval = check_interval
         self.timeout = timeout
         self.max_failures = max_failures
+        self.max_concurrent_probes = max(1, max_concurrent_probes)
         
         self._connections: Dict[str, ConnectionInfo] = {}
         self._health_checks: Dict[str, str] = {}  # connection_id -> health_url
@@ -97,6 +115,8 @@ class ConnectionHealthMonitor:
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
         self._callbacks: List[Callable[[str, bool], None]] = []
+        # 健康检查复用的会话（懒创建），保留连接池、DNS 缓存与 keep-alive
+        self._http_session: Optional[aiohttp.ClientSession] = None
     
     def add_connection(
         self,
@@ -200,40 +220,63 @@ class ConnectionHealthMonitor:
         
         if self._monitor_task:
             self._monitor_task.cancel()
-            try:
-                asyncio.get_event_loop().run_until_complete(
-                    asyncio.wait_for(self._monitor_task, timeout=1.0)
-                )
-            except Exception:
-                pass
+    
+    async def close(self) -> None:
+        """停止健康监控，等待监控任务结束并关闭健康检查会话"""
+        task = self._monitor_task
+        self.stop()
+        
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+            self._monitor_task = None
+        
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """获取健康检查会话，首次使用时创建"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
+        return self._http_session
     
     def get_health_report(self) -> Dict[str, Any]:
-        """获取健康报告"""
-        total = len(self._connections)
-        healthy = sum(1 for info in self._connections.values() if info.is_healthy)
-        unhealthy = total - healthy
+        """获取健康报告
         
-        avg_latency = (
-            sum(info.latency_ms for info in self._connections.values()) / total
-            if total > 0 else 0.0
-        )
+        计数、延迟汇总与各连接详情在同一次遍历中完成。
+        """
+        now = time.time()
+        total = len(self._connections)
+        healthy = 0
+        latency_sum = 0.0
+        connections: Dict[str, Dict[str, Any]] = {}
+        
+        for conn_id, info in self._connections.items():
+            if info.is_healthy:
+                healthy += 1
+            latency_sum += info.latency_ms
+            connections[conn_id] = {
+                "healthy": info.is_healthy,
+                "request_count": info.request_count,
+                "failed_requests": info.failed_requests,
+                "latency_ms": round(info.latency_ms, 2),
+                "age_seconds": now - info.created_at,
+            }
         
         return {
             "total_connections": total,
             "healthy": healthy,
-            "unhealthy": unhealthy,
+            "unhealthy": total - healthy,
             "health_rate": healthy / total if total > 0 else 0.0,
-            "avg_latency_ms": round(avg_latency, 2),
-            "connections": {
-                conn_id: {
-                    "healthy": info.is_healthy,
-                    "request_count": info.request_count,
-                    "failed_requests": info.failed_requests,
-                    "latency_ms": round(info.latency_ms, 2),
-                    "age_seconds": time.time() - info.created_at,
-                }
-                for conn_id, info in self._connections.items()
-            },
+            "avg_latency_ms": round(latency_sum / total, 2) if total > 0 else 0.0,
+            "connections": connections,
         }
     
     def _notify_health_change(self, connection_id: str, is_healthy: bool) -> None:
@@ -256,23 +299,37 @@ class ConnectionHealthMonitor:
                 logger.error(f"健康监控错误: {e}")
     
     async def _perform_health_checks(self) -> None:
-        """执行健康检查"""
-        for connection_id, url in self._health_checks.items():
+        """执行健康检查
+        
+        各连接的探测并发执行，总耗时取决于最慢的一次探测而不是所有探测之和；
+        同时在途的请求数受 max_concurrent_probes 限制，避免对后端造成突发压力。
+        """
+        if not self._health_checks:
+            return
+        
+        session = self._get_http_session()
+        semaphore = asyncio.Semaphore(self.max_concurrent_probes)
+        
+        async def probe(connection_id: str, url: str) -> None:
             try:
-                # 这里使用HEAD请求进行轻量级检查
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    start = time.time()
+                async with semaphore:
+                    # 这里使用HEAD请求进行轻量级检查
+                    start = time.perf_counter()
                     async with session.head(url, allow_redirects=True) as resp:
-                        latency = (time.time() - start) * 1000
+                        latency = (time.perf_counter() - start) * 1000
                         
                         if resp.status < 500:
                             self.update_connection_usage(connection_id, latency, failed=False)
                         else:
                             self.update_connection_usage(connection_id, latency, failed=True)
-                            
+                        
             except Exception:
                 self.update_connection_usage(connection_id, failed=True)
+        
+        await asyncio.gather(*(
+            probe(connection_id, url)
+            for connection_id, url in list(self._health_checks.items())
+        ))
 
 
 class OptimizedConnectionPool:
@@ -345,6 +402,8 @@ class OptimizedConnectionPool:
         # 统计
         self._stats = ConnectionStats()
         self._response_times: deque = deque(maxlen=1000)
+        # 响应时间窗口的滚动总和，求平均值时无需每次遍历整个窗口
+        self._response_time_total = 0.0
         self._initialized = False
         
         # SSL上下文（复用）
@@ -418,7 +477,7 @@ class OptimizedConnectionPool:
             return
         
         # 停止健康监控
-        self._health_monitor.stop()
+        await self._health_monitor.close()
         
         # 关闭session
         if self._session:
@@ -465,13 +524,13 @@ class OptimizedConnectionPool:
         if not self._session:
             raise RuntimeError("连接池未初始化")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         self._stats.total_requests += 1
         
         try:
             async with self._session.request(method, url, **kwargs) as resp:
-                elapsed_ms = (time.time() - start_time) * 1000
-                self._response_times.append(elapsed_ms)
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                self._record_response_time(elapsed_ms)
                 
                 # 更新统计
                 self._update_stats_from_response(resp)
@@ -500,10 +559,7 @@ class OptimizedConnectionPool:
                 "size": len(self._connector._conns),  # 当前连接数
             }
         
-        avg_response_time = (
-            sum(self._response_times) / len(self._response_times)
-            if self._response_times else 0.0
-        )
+        avg_response_time = self._average_response_time()
         
         return {
             "requests": {
@@ -526,6 +582,22 @@ class OptimizedConnectionPool:
         """重置统计"""
         self._stats = ConnectionStats()
         self._response_times.clear()
+        self._response_time_total = 0.0
+    
+    def _record_response_time(self, elapsed_ms: float) -> None:
+        """记录响应时间并维护窗口总和"""
+        times = self._response_times
+        if len(times) == times.maxlen:
+            # 窗口已满，追加时最旧的值会被挤出
+            self._response_time_total -= times[0]
+        times.append(elapsed_ms)
+        self._response_time_total += elapsed_ms
+    
+    def _average_response_time(self) -> float:
+        """窗口内的平均响应时间（毫秒）"""
+        if not self._response_times:
+            return 0.0
+        return self._response_time_total / len(self._response_times)
     
     def _create_ssl_context(self) -> Optional[ssl.SSLContext]:
         """创建优化的SSL上下文"""
@@ -558,7 +630,7 @@ class OptimizedConnectionPool:
         
         # 更新平均响应时间
         if self._response_times:
-            self._stats.avg_response_time_ms = sum(self._response_times) / len(self._response_times)
+            self._stats.avg_response_time_ms = self._average_response_time()
 
 
 class PooledClient:
@@ -7,11 +7,17 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Any, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 
 from ..interfaces import IClassifier, ClassificationResult
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class TrieNode:
     """Trie 树节点"""
@@ -51,14 +57,32 @@ class TrieClassifier(IClassifier):
     
     def _build_trie(self) -> None:
         """构建 Trie 树"""
+        keyword_nodes: Dict[str, TrieNode] = {}
         for category, keywords in self._keywords_by_category.items():
             if category == "other":
                 continue
             
             for keyword in keywords:
-                self._insert_keyword(keyword.lower(), category)
+                keyword = keyword.lower()
+                keyword_nodes[keyword] = self._insert_keyword(keyword, category)
+        
+        # 安装了 pyahocorasick 时使用 C 实现的自动机，一次扫描完成匹配
+        self._automaton: Optional[Any] = (
+            self._build_automaton(keyword_nodes) if AHOCORASICK_AVAILABLE else None
+        )
     
-    def _insert_keyword(self, keyword: str, category: str) -> None:
+    @staticmethod
+    def _build_automaton(keyword_nodes: Dict[str, TrieNode]) -> Any:
+        """根据 Trie 中的关键词构建 Aho-Corasick 自动机"""
+        automaton = ahocorasick.Automaton()
+        for keyword, node in keyword_nodes.items():
+            if keyword:
+                # 共享节点的分类集合，保持与 Trie 遍历相同的分类顺序
+                automaton.add_word(keyword, (keyword, node.categories))
+        automaton.make_automaton()
+        return automaton
+    
+    def _insert_keyword(self, keyword: str, category: str) -> TrieNode:
         """插入关键词到 Trie"""
         node = self._root
         for char in keyword:
@@ -69,6 +93,7 @@ class TrieClassifier(IClassifier):
         node.is_end = True
         node.categories.add(category)
         node.keyword = keyword
+        return node
     
     def _search(self, text: str) -> List[TrieMatch]:
         """在文本中搜索所有匹配的关键词
@@ -78,6 +103,20 @@ class TrieClassifier(IClassifier):
         matches = []
         text_lower = text.lower()
         
+        if self._automaton is not None:
+            for end, (keyword, categories) in self._automaton.iter(text_lower):
+                position = end - len(keyword) + 1
+                for category in categories:
+                    matches.append(TrieMatch(
+                        keyword=keyword,
+                        category=category,
+                        position=position
+                    ))
+            # 自动机按结束位置输出，按 (起始位置, 长度) 排序以保持与
+            # Trie 遍历一致的顺序（同分数分类按首次出现顺序取舍）
+            matches.sort(key=lambda m: (m.position, len(m.keyword)))
+            return matches
+        
         for i in range(len(text_lower)):
             node = self._root
             j = i
@@ -268,7 +268,21 @@ class BasePlugin(abc.ABC):
         """
         if event_name not in self._event_handlers:
             self._event_handlers[event_name] = []
-        self._event_handlers[event_name].append(handler)
+        self._event_handlers[event_name].append(self._make_dispatcher(handler))
+    
+    @staticmethod
+    def _make_dispatcher(handler: Callable) -> Callable:
+        """在注册时根据处理器类型生成专用的分发函数
+        
+        协程处理器包装为创建任务，同步处理器直接调用，
+        触发事件时无需再逐个判断处理器类型。
+        """
+        if not asyncio.iscoroutinefunction(handler):
+            return handler
+        
+        def dispatch(*args, **kwargs) -> None:
+            asyncio.create_task(handler(*args, **kwargs))
+        return dispatch
         
     def emit_event(self, event_name: str, *args, **kwargs) -> None:
         """触发事件
@@ -279,12 +293,9 @@ class BasePlugin(abc.ABC):
             **kwargs: 关键字参数
         """
         handlers = self._event_handlers.get(event_name, [])
-        for handler in handlers:
+        for dispatch in handlers:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    asyncio.create_task(handler(*args, **kwargs))
-                else:
-                    handler(*args, **kwargs)
+                dispatch(*args, **kwargs)
             except Exception as e:
                 self._logger.error(f"事件处理器执行失败: {e}")
                 
@@ -5,7 +5,7 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 
@@ -105,6 +105,8 @@ Category:"""
         super().__init__()
         self._session: Optional[aiohttp.ClientSession] = None
         self._rule_keywords: Dict[str, List[str]] = {}
+        # 预处理的规则：(分类, ((小写关键词, 原关键词长度), ...))
+        self._rule_matchers: List[Tuple[str, Tuple[Tuple[str, int], ...]]] = []
     
     async def initialize(self) -> bool:
         """初始化分类器"""
@@ -300,11 +302,11 @@ Category:"""
         best_match = None
         best_score = 0
         
-        for category, keywords in self._rule_keywords.items():
+        for category, keywords in self._rule_matchers:
             score = 0
-            for keyword in keywords:
-                if keyword.lower() in name_lower:
-                    score += len(keyword)
+            for keyword, length in keywords:
+                if keyword in name_lower:
+                    score += length
             
             if score > best_score:
                 best_score = score
@@ -357,6 +359,18 @@ Category:"""
                 "Book", "Novel"
             ]
         }
+        self._compile_rule_keywords()
+    
+    def _compile_rule_keywords(self) -> None:
+        """预处理规则关键词
+        
+        关键词预先转为小写并记录计分长度，避免每次分类都对每个关键词
+        重复调用 lower()。
+        """
+        self._rule_matchers = [
+            (category, tuple((kw.lower(), len(kw)) for kw in keywords if kw))
+            for category, keywords in self._rule_keywords.items()
+        ]
     
     async def _test_connection(self) -> bool:
         """测试与本地 AI 服务的连接
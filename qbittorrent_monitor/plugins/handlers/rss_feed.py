@@ -4,11 +4,13 @@
 """
 
 import logging
+import re
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
 import aiohttp
 
@@ -18,16 +20,41 @@ from ...security import validate_url
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=128)
+def _compile_keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """将关键词列表编译为单个多选正则
+
+    关键词预先转为小写，匹配时只需对标题做一次 lower()，
+    一次扫描即可判断是否命中任意关键词。同一订阅的过滤配置
+    每次检查都相同，编译结果按关键词元组缓存。
+    """
+    return re.compile("|".join(re.escape(kw.lower()) for kw in keywords))
+
+
 class RSSItem:
     """RSS 条目"""
-    title: str
-    link: str
-    description: str = ""
-    pub_date: Optional[datetime] = None
-    enclosure_url: Optional[str] = None
-    guid: str = ""
-    categories: List[str] = field(default_factory=list)
+    
+    __slots__ = (
+        "title", "link", "description", "pub_date", "enclosure_url", "guid", "categories",
+    )
+    
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        description: str = "",
+        pub_date: Optional[datetime] = None,
+        enclosure_url: Optional[str] = None,
+        guid: str = "",
+        categories: Optional[List[str]] = None,
+    ):
+        self.title = title
+        self.link = link
+        self.description = description
+        self.pub_date = pub_date
+        self.enclosure_url = enclosure_url
+        self.guid = guid
+        self.categories = categories if categories is not None else []
     
     @property
     def is_torrent(self) -> bool:
@@ -74,6 +101,9 @@ class RSSFeedHandler(HandlerPlugin):
         ... })
     """
     
+    # 已处理 GUID 的最大记录数
+    MAX_PROCESSED_GUIDS = 10000
+    
     @property
     def metadata(self) -> PluginMetadata:
         return PluginMetadata(
@@ -124,7 +154,8 @@ class RSSFeedHandler(HandlerPlugin):
     def __init__(self):
         super().__init__()
         self._session: Optional[aiohttp.ClientSession] = None
-        self._processed_guids: set = set()  # 已处理的条目
+        # 已处理的条目（按处理顺序保存，超出上限时淘汰最早的记录）
+        self._processed_guids: Dict[str, None] = {}
         self._last_check: Dict[str, datetime] = {}  # 上次检查时间
     
     async def initialize(self) -> bool:
@@ -230,7 +261,7 @@ class RSSFeedHandler(HandlerPlugin):
                 result = await self._process_item(item, **kwargs)
                 if result:
                     processed.append(item.title)
-                    self._processed_guids.add(item.guid)
+                    self._mark_processed(item.guid)
             
             # 保存状态
             await self._save_processed_guids()
@@ -452,31 +483,28 @@ class RSSFeedHandler(HandlerPlugin):
         Returns:
             过滤后的条目列表
         """
-        result = items
-        
-        # 关键词过滤
         keywords = filter_config.get("keywords", [])
-        if keywords:
-            result = [
-                item for item in result
-                if any(kw.lower() in item.title.lower() for kw in keywords)
-            ]
-        
-        # 排除关键词
         exclude = filter_config.get("exclude", [])
-        if exclude:
-            result = [
-                item for item in result
-                if not any(ex.lower() in item.title.lower() for ex in exclude)
-            ]
-        
-        # 分类过滤
         categories = filter_config.get("categories", [])
-        if categories:
-            result = [
-                item for item in result
-                if any(cat in item.categories for cat in categories)
-            ]
+        if not (keywords or exclude or categories):
+            return items
+        
+        keyword_search = _compile_keyword_pattern(tuple(keywords)).search if keywords else None
+        exclude_search = _compile_keyword_pattern(tuple(exclude)).search if exclude else None
+        category_set = frozenset(categories)
+        
+        # 单次遍历：先做无需转换大小写的分类检查，标题只转换一次小写，
+        # 排除关键词先于包含关键词检查以尽早跳过
+        result = []
+        for item in items:
+            if category_set and category_set.isdisjoint(item.categories):
+                continue
+            title_lower = item.title.lower()
+            if exclude_search is not None and exclude_search(title_lower):
+                continue
+            if keyword_search is not None and not keyword_search(title_lower):
+                continue
+            result.append(item)
         
         return result
     
@@ -530,10 +558,17 @@ class RSSFeedHandler(HandlerPlugin):
         
         raise ValueError(f"无法解析日期: {date_str}")
     
+    def _mark_processed(self, guid: str) -> None:
+        """记录已处理的 GUID，超出上限时淘汰最早处理的记录"""
+        guids = self._processed_guids
+        guids.pop(guid, None)
+        guids[guid] = None
+        while len(guids) > self.MAX_PROCESSED_GUIDS:
+            del guids[next(iter(guids))]
+    
     async def _load_processed_guids(self) -> None:
         """加载已处理的 GUID"""
         import json
-        from pathlib import Path
         
         guid_file = self.config_dir / "rss_processed_guids.json"
         
@@ -541,7 +576,8 @@ class RSSFeedHandler(HandlerPlugin):
             try:
                 with open(guid_file, "r") as f:
                     data = json.load(f)
-                    self._processed_guids = set(data.get("guids", []))
+                    guids = data.get("guids", [])[-self.MAX_PROCESSED_GUIDS:]
+                    self._processed_guids = dict.fromkeys(guids)
                     self._last_check = {
                         k: datetime.fromisoformat(v)
                         for k, v in data.get("last_check", {}).items()
@@ -552,16 +588,12 @@ class RSSFeedHandler(HandlerPlugin):
     async def _save_processed_guids(self) -> None:
         """保存已处理的 GUID"""
         import json
-        from pathlib import Path
         
         guid_file = self.config_dir / "rss_processed_guids.json"
         
         try:
-            # 限制 GUID 数量，避免文件过大
-            max_guids = 10000
+            # 内存中的记录已限制数量且按处理顺序排列，避免文件过大
             guids = list(self._processed_guids)
-            if len(guids) > max_guids:
-                guids = guids[-max_guids:]
             
             data = {
                 "guids": guids,
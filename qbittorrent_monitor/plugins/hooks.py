@@ -4,9 +4,11 @@
 """
 
 import asyncio
+import bisect
+import itertools
 import logging
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Awaitable, Union
+from typing import Any, Callable, Dict, List, Optional, Awaitable, Tuple, Union
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -15,10 +17,11 @@ logger = logging.getLogger(__name__)
 HookCallback = Callable[..., Awaitable[Any]]
 
 
-class HookType(Enum):
+class HookType(str, Enum):
     """钩子类型枚举
     
-    定义系统中可用的钩子点。
+    定义系统中可用的钩子点。混入 str：成员本身即字符串，
+    作为 ``_hooks`` 字典键时走 C 层 str 哈希，而不是 Enum.__hash__。
     """
     # 内容处理钩子
     PRE_PROCESS = "pre_process"       # 处理前
@@ -53,7 +56,16 @@ class HookPriority(Enum):
 
 
 class Hook:
-    """钩子定义"""
+    """钩子定义
+    
+    按 (优先级, 注册顺序) 比较大小，同优先级的钩子保持注册顺序。
+    """
+    
+    __slots__ = (
+        "callback", "priority", "plugin_name", "once", "call_count", "is_coro", "seq",
+    )
+    
+    _seq_counter = itertools.count()
     
     def __init__(
         self,
@@ -67,6 +79,12 @@ class Hook:
         self.plugin_name = plugin_name
         self.once = once
         self.call_count = 0
+        # 注册时判定一次，避免每次调用都走 inspect 探测
+        self.is_coro = asyncio.iscoroutinefunction(callback)
+        self.seq = next(Hook._seq_counter)
+    
+    def __lt__(self, other: "Hook") -> bool:
+        return (self.priority.value, self.seq) < (other.priority.value, other.seq)
         
     async def invoke(self, *args, **kwargs) -> Any:
         """调用钩子
@@ -81,7 +99,7 @@ class Hook:
         try:
             self.call_count += 1
             
-            if asyncio.iscoroutinefunction(self.callback):
+            if self.is_coro:
                 return await self.callback(*args, **kwargs)
             else:
                 return self.callback(*args, **kwargs)
@@ -100,6 +118,9 @@ class HookRegistry:
     
     管理所有钩子的注册、调用和生命周期。
     
+    每种钩子以不可变元组保存（写时复制）：注册、注销时整体替换，
+    调用时直接遍历当前快照，无需每次复制列表。
+    
     Example:
         >>> registry = HookRegistry()
         >>> 
@@ -124,8 +145,8 @@ class HookRegistry:
         if self._initialized:
             return
             
-        self._hooks: Dict[HookType, List[Hook]] = {
-            hook_type: [] for hook_type in HookType
+        self._hooks: Dict[HookType, Tuple[Hook, ...]] = {
+            hook_type: () for hook_type in HookType
         }
         self._initialized = True
         self._lock = asyncio.Lock()
@@ -166,10 +187,10 @@ class HookRegistry:
             hook_type: 钩子类型
             hook: 钩子实例
         """
-        hooks = self._hooks[hook_type]
-        hooks.append(hook)
-        # 按优先级排序
-        hooks.sort(key=lambda h: h.priority.value)
+        # 二分插入，保持按优先级有序，无需每次注册都整体重排
+        hooks = list(self._hooks[hook_type])
+        bisect.insort(hooks, hook)
+        self._hooks[hook_type] = tuple(hooks)
         
         logger.debug(f"已注册钩子 {hook_type.value} (优先级: {hook.priority.name})")
     
@@ -194,17 +215,17 @@ class HookRegistry:
         
         if callback is None and plugin_name is None:
             # 清除所有
-            self._hooks[hook_type] = []
+            self._hooks[hook_type] = ()
             return original_count
             
         # 过滤掉匹配的钩子
-        self._hooks[hook_type] = [
+        self._hooks[hook_type] = tuple(
             h for h in hooks 
             if not (
                 (callback is None or h.callback == callback) and
                 (plugin_name is None or h.plugin_name == plugin_name)
             )
-        ]
+        )
         
         removed = original_count - len(self._hooks[hook_type])
         logger.debug(f"已注销 {removed} 个 {hook_type.value} 钩子")
@@ -230,7 +251,7 @@ class HookRegistry:
         Returns:
             所有钩子的返回值列表
         """
-        hooks = self._hooks[hook_type].copy()
+        hooks = self._hooks[hook_type]
         results = []
         hooks_to_remove = []
         
@@ -249,8 +270,10 @@ class HookRegistry:
                     raise
                     
         # 清理一次性钩子
-        for hook in hooks_to_remove:
-            self._hooks[hook_type].remove(hook)
+        if hooks_to_remove:
+            self._hooks[hook_type] = tuple(
+                h for h in self._hooks[hook_type] if h not in hooks_to_remove
+            )
             
         return results
     
@@ -333,7 +356,7 @@ class HookRegistry:
             钩子列表
         """
         if hook_type is not None:
-            hooks = self._hooks[hook_type]
+            hooks = list(self._hooks[hook_type])
         else:
             hooks = []
             for h_list in self._hooks.values():
@@ -347,7 +370,7 @@ class HookRegistry:
     def clear(self) -> None:
         """清除所有钩子"""
         for hook_type in self._hooks:
-            self._hooks[hook_type] = []
+            self._hooks[hook_type] = ()
         logger.info("已清除所有钩子")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -3,6 +3,7 @@
 负责插件的加载、启用、禁用和生命周期管理。
 """
 
+import heapq
 import importlib
 import importlib.util
 import inspect
@@ -11,7 +12,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, Callable
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
 import asyncio
 
 from .base import BasePlugin, PluginMetadata, PluginState, PluginType
@@ -219,6 +220,12 @@ class PluginManager:
                     logger.warning(f"插件名称冲突: {name}，跳过")
                     continue
                 
+                # 检查循环依赖（注册时发现，而不是等到启用时）
+                cycle = self._find_dependency_cycle(name, plugin.metadata.dependencies)
+                if cycle:
+                    logger.error(f"插件 {name} 存在循环依赖: {' -> '.join(cycle)}，跳过")
+                    continue
+                
                 # 加载配置
                 config = self._load_plugin_config(name)
                 if config:
@@ -240,6 +247,38 @@ class PluginManager:
         logger.info(f"成功加载 {loaded_count} 个插件")
         return loaded_count
     
+    def _find_dependency_cycle(
+        self,
+        name: str,
+        dependencies: List[str]
+    ) -> Optional[List[str]]:
+        """检查注册新插件是否会形成循环依赖
+        
+        从新插件的依赖出发，沿已注册插件的依赖做深度优先搜索，
+        若能回到新插件本身则说明新增的边闭合了一个环。
+        
+        Args:
+            name: 待注册的插件名称
+            dependencies: 该插件的依赖列表
+            
+        Returns:
+            环路径（首尾均为 name），无环时返回 None
+        """
+        visited: Set[str] = set()
+        stack: List[Tuple[str, List[str]]] = [(dep, [name, dep]) for dep in dependencies]
+        
+        while stack:
+            current, path = stack.pop()
+            if current == name:
+                return path
+            if current in visited or current not in self._plugins:
+                continue
+            visited.add(current)
+            for dep in self._plugins[current].metadata.dependencies:
+                stack.append((dep, path + [dep]))
+        
+        return None
+    
     def _load_plugin_config(self, plugin_name: str) -> Dict[str, Any]:
         """加载插件配置
         
@@ -368,26 +407,73 @@ class PluginManager:
         logger.info(f"已卸载插件: {name}")
         return True
     
+    def _dependency_order(self) -> Tuple[List[str], List[str]]:
+        """按依赖关系计算插件的拓扑顺序（Kahn 算法）
+        
+        维护入度表与就绪堆，每条依赖边只访问一次，复杂度 O(N + E)。
+        同一批就绪插件按加载顺序出堆，保持原有的启用顺序。
+        未加载的依赖不计入入度，由 enable_plugin 负责报告。
+        
+        Returns:
+            (拓扑顺序, 因循环依赖无法排序的插件列表)
+        """
+        index = {name: i for i, name in enumerate(self._plugins)}
+        indegree: Dict[str, int] = dict.fromkeys(self._plugins, 0)
+        dependents: Dict[str, List[str]] = {name: [] for name in self._plugins}
+        
+        for name, plugin in self._plugins.items():
+            for dep in set(plugin.metadata.dependencies):
+                if dep in dependents:
+                    dependents[dep].append(name)
+                    indegree[name] += 1
+        
+        ready = [(index[name], name) for name, deg in indegree.items() if deg == 0]
+        heapq.heapify(ready)
+        
+        order: List[str] = []
+        while ready:
+            _, name = heapq.heappop(ready)
+            order.append(name)
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    heapq.heappush(ready, (index[dependent], dependent))
+        
+        unresolved = [name for name, deg in indegree.items() if deg > 0]
+        return order, unresolved
+    
     async def enable_all(self) -> Dict[str, bool]:
         """启用所有已加载的插件
         
+        按依赖拓扑顺序启用，依赖总是先于依赖它的插件启用。
+        
         Returns:
             每个插件的启用结果
         """
+        order, unresolved = self._dependency_order()
+        
         results = {}
-        for name in self._plugins:
+        for name in order:
             results[name] = await self.enable_plugin(name)
+        
+        for name in unresolved:
+            logger.error(f"插件 {name} 存在循环依赖，跳过启用")
+            results[name] = False
         return results
     
     async def disable_all(self) -> Dict[str, bool]:
         """禁用所有已启用的插件
         
+        按依赖拓扑的逆序禁用，依赖它的插件总是先被禁用。
+        
         Returns:
             每个插件的禁用结果
         """
+        order, unresolved = self._dependency_order()
+        
         results = {}
-        for name, plugin in self._plugins.items():
-            if plugin.is_enabled:
+        for name in reversed(order + unresolved):
+            if self._plugins[name].is_enabled:
                 results[name] = await self.disable_plugin(name)
         return results
     
@@ -512,18 +598,30 @@ class PluginManager:
         """
         from .base import NotifierPlugin
         
-        results = {}
-        notifiers = self.get_plugins_by_type(PluginType.NOTIFIER)
+        notifiers = [
+            plugin for plugin in self.get_plugins_by_type(PluginType.NOTIFIER)
+            if plugin.is_enabled and isinstance(plugin, NotifierPlugin)
+        ]
         
-        for plugin in notifiers:
-            if plugin.is_enabled and isinstance(plugin, NotifierPlugin):
-                try:
-                    results[plugin.name] = await plugin.notify(title, message, **kwargs)
-                except Exception as e:
-                    logger.error(f"通知插件 {plugin.name} 执行失败: {e}")
-                    results[plugin.name] = False
-                    
-        return results
+        async def _notify(plugin: NotifierPlugin) -> bool:
+            try:
+                return await plugin.notify(title, message, **kwargs)
+            except Exception as e:
+                logger.error(f"通知插件 {plugin.name} 执行失败: {e}")
+                return False
+        
+        # 各通知插件相互独立，并发发送；TaskGroup 保证所有子任务一起完成或一起取消
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_notify(plugin), name=f"notify:{plugin.name}")
+                    for plugin in notifiers
+                ]
+            outcomes = [task.result() for task in tasks]
+        else:
+            outcomes = await asyncio.gather(*(_notify(plugin) for plugin in notifiers))
+        
+        return {plugin.name: outcome for plugin, outcome in zip(notifiers, outcomes)}
     
     async def classify_with_plugins(
         self, 
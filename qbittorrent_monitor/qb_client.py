@@ -102,15 +102,14 @@ def with_retry(
                         jitter = delay * 0.2 * (2 * random.random() - 1)
                         sleep_time = delay + jitter
                         
-                        func_name = func.__name__
                         logger.warning(
-                            f"{func_name} 第 {attempt + 1}/{max_retries + 1} 次尝试失败，"
-                            f"{sleep_time:.2f}秒后重试..."
+                            "%s 第 %d/%d 次尝试失败，%.2f秒后重试...",
+                            func.__name__, attempt + 1, max_retries + 1, sleep_time
                         )
                         await asyncio.sleep(sleep_time)
                     else:
                         logger.error(
-                            f"{func.__name__} 在 {max_retries + 1} 次尝试后仍然失败"
+                            "%s 在 %d 次尝试后仍然失败", func.__name__, max_retries + 1
                         )
             
             # 重试耗尽，抛出异常
@@ -51,14 +51,14 @@ class CacheManager:
             data: 请求数据
         
         Returns:
-            MD5哈希缓存键
+            BLAKE2b-128哈希缓存键
         """
         key_data = f"{method}:{url}"
         if params:
             key_data += f":params:{sorted(params.items())}"
         if data:
             key_data += f":data:{sorted(data.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
     
     def get(self, key: str) -> Optional[Any]:
         """获取缓存值
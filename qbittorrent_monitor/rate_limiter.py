@@ -7,10 +7,10 @@
 
 import time
 import asyncio
-from typing import Dict, Optional, List, Tuple, Callable, Any
-from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Callable, Any
+from dataclasses import dataclass
 from enum import Enum
-from collections import defaultdict, deque
+from collections import deque
 from functools import wraps
 
 from .exceptions_unified import QBittorrentMonitorError
@@ -5,7 +5,6 @@
 """
 
 import os
-import sys
 import time
 import asyncio
 import logging
@@ -89,19 +88,36 @@ class ResourceStats:
     average_cpu_percent: float = 0.0
     violation_count: int = 0
     warning_count: int = 0
+    # 窗口内的累计值，用于 O(1) 更新平均值
+    _memory_sum: float = field(default=0.0, init=False, repr=False)
+    _cpu_sum: float = field(default=0.0, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        for s in self.snapshots:
+            self._memory_sum += s.memory_mb
+            self._cpu_sum += s.cpu_percent
     
     def add_snapshot(self, snapshot: ResourceSnapshot) -> None:
         """添加快照"""
-        self.snapshots.append(snapshot)
+        snapshots = self.snapshots
+        # 窗口已满时，append 会挤出最旧的快照，先从累计值中扣除
+        if snapshots.maxlen is not None and len(snapshots) == snapshots.maxlen:
+            evicted = snapshots[0]
+            self._memory_sum -= evicted.memory_mb
+            self._cpu_sum -= evicted.cpu_percent
+        
+        snapshots.append(snapshot)
+        self._memory_sum += snapshot.memory_mb
+        self._cpu_sum += snapshot.cpu_percent
         
         # 更新峰值
         self.peak_memory_mb = max(self.peak_memory_mb, snapshot.memory_mb)
         self.peak_cpu_percent = max(self.peak_cpu_percent, snapshot.cpu_percent)
         
         # 计算平均值
-        if self.snapshots:
-            self.average_memory_mb = sum(s.memory_mb for s in self.snapshots) / len(self.snapshots)
-            self.average_cpu_percent = sum(s.cpu_percent for s in self.snapshots) / len(self.snapshots)
+        count = len(snapshots)
+        self.average_memory_mb = self._memory_sum / count
+        self.average_cpu_percent = self._cpu_sum / count
     
     def record_violation(self) -> None:
         """记录违规"""
@@ -148,6 +164,8 @@ class ResourceMonitor:
             self._psutil = psutil
             self._psutil_available = True
             self._process = psutil.Process(self._process_id)
+            # 以非阻塞方式采样 CPU：首次调用建立基准，之后返回两次调用间的使用率
+            self._process.cpu_percent(interval=None)
         except ImportError:
             self._psutil = None
             self._process = None
@@ -173,7 +191,7 @@ class ResourceMonitor:
         """获取CPU使用率"""
         if self._psutil_available and self._process:
             try:
-                return self._process.cpu_percent(interval=0.1)
+                return self._process.cpu_percent(interval=None)
             except Exception:
                 pass
         
@@ -221,22 +239,30 @@ class ResourceMonitor:
         
         return threading.active_count()
     
+    def _take_snapshot(self) -> ResourceSnapshot:
+        """采集一次资源快照
+        
+        psutil 可用时在 oneshot() 中读取，同一进程的多项指标共享底层的 /proc 读取。
+        """
+        if self._process is not None:
+            with self._process.oneshot():
+                return self._collect_snapshot()
+        return self._collect_snapshot()
+    
+    def _collect_snapshot(self) -> ResourceSnapshot:
+        """读取各项资源指标并生成快照"""
+        return ResourceSnapshot(
+            timestamp=time.time(),
+            memory_mb=self._get_memory_usage(),
+            cpu_percent=self._get_cpu_percent(),
+            disk_mb=self._get_disk_usage(),
+            thread_count=self._get_thread_count()
+        )
+    
     async def _check_resources(self) -> None:
         """检查资源使用情况"""
         try:
-            # 获取资源使用
-            memory_mb = self._get_memory_usage()
-            cpu_percent = self._get_cpu_percent()
-            disk_mb = self._get_disk_usage()
-            thread_count = self._get_thread_count()
-            
-            snapshot = ResourceSnapshot(
-                timestamp=time.time(),
-                memory_mb=memory_mb,
-                cpu_percent=cpu_percent,
-                disk_mb=disk_mb,
-                thread_count=thread_count
-            )
+            snapshot = self._take_snapshot()
             
             async with self._lock:
                 self.stats.add_snapshot(snapshot)
@@ -314,13 +340,15 @@ class ResourceMonitor:
         if self._running:
             return
         
-        self._running = True
         try:
-            loop = asyncio.get_event_loop()
-            self._monitor_task = loop.create_task(self._monitor_loop())
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            # 没有运行的事件循环
-            pass
+            # 没有运行的事件循环，无法创建监控任务
+            logger.warning("没有运行中的事件循环，资源监控未启动")
+            return
+        
+        self._running = True
+        self._monitor_task = loop.create_task(self._monitor_loop(), name="resource_monitor")
         
         logger.info("资源监控已启动")
     
@@ -330,7 +358,7 @@ class ResourceMonitor:
             return
         
         self._running = True
-        self._monitor_task = asyncio.create_task(self._monitor_loop())
+        self._monitor_task = asyncio.create_task(self._monitor_loop(), name="resource_monitor")
         logger.info("资源监控已启动")
     
     def stop(self) -> None:
@@ -346,10 +374,7 @@ class ResourceMonitor:
         self._running = False
         if self._monitor_task:
             self._monitor_task.cancel()
-            try:
-                await self._monitor_task
-            except asyncio.CancelledError:
-                pass
+            await asyncio.gather(self._monitor_task, return_exceptions=True)
             self._monitor_task = None
         logger.info("资源监控已停止")
     
@@ -366,18 +391,7 @@ class ResourceMonitor:
     
     async def get_current_usage(self) -> ResourceSnapshot:
         """获取当前资源使用"""
-        memory_mb = self._get_memory_usage()
-        cpu_percent = self._get_cpu_percent()
-        disk_mb = self._get_disk_usage()
-        thread_count = self._get_thread_count()
-        
-        return ResourceSnapshot(
-            timestamp=time.time(),
-            memory_mb=memory_mb,
-            cpu_percent=cpu_percent,
-            disk_mb=disk_mb,
-            thread_count=thread_count
-        )
+        return self._take_snapshot()
     
     async def get_stats(self) -> ResourceStats:
         """获取统计信息"""
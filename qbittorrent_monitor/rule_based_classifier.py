@@ -7,10 +7,62 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# 含有这些字符的关键词按正则表达式处理
+_REGEX_SPECIAL_CHARS = frozenset(".*+?^${}()|[]\\")
+
+# 正则关键词中含有这些片段时，转小写可能改变语义（如 \S -> \s、
+# [A-z] -> [a-z]、(?L)），只能保留 IGNORECASE 匹配原样关键词
+_CASE_SENSITIVE_SYNTAX = ("\\", "[", "(?")
+
+# 预编译后的规则，按匹配方式分组，打分时无需逐项判断类型：
+# - 普通关键词：(小写关键词, 权重)，按出现次数计分
+# - 正则关键词：每个匹配计 2 分
+# - 正则编译失败的关键词：降级为小写子串包含，计 1 分
+CompiledRule = Tuple[
+    Tuple[Tuple[str, int], ...],
+    Tuple[re.Pattern, ...],
+    Tuple[str, ...],
+]
+
+
+@lru_cache(maxsize=256)
+def _compile_keyword_tuple(keywords: Tuple[str, ...]) -> CompiledRule:
+    """预编译关键词元组（按内容缓存，见 RuleBasedClassifier._compile_keywords）"""
+    plain: List[Tuple[str, int]] = []
+    regexes: List[re.Pattern] = []
+    fallbacks: List[str] = []
+
+    for keyword in keywords:
+        if not keyword:
+            continue
+
+        keyword_lower = keyword.lower()
+        if _REGEX_SPECIAL_CHARS.isdisjoint(keyword):
+            # 简单的字符串匹配，长关键词权重更高
+            plain.append((keyword_lower, max(1, len(keyword) // 3)))
+            continue
+
+        try:
+            # 打分时匹配对象是已转小写的名称：能安全转小写的正则直接编译
+            # 小写形式，省去 IGNORECASE 逐字符大小写折叠的开销
+            if keyword == keyword_lower or not any(
+                token in keyword for token in _CASE_SENSITIVE_SYNTAX
+            ):
+                regexes.append(re.compile(keyword_lower))
+            else:
+                regexes.append(re.compile(keyword, re.IGNORECASE))
+        except re.error:
+            # 正则表达式错误，降级为普通字符串匹配
+            fallbacks.append(keyword_lower)
+
+    return tuple(plain), tuple(regexes), tuple(fallbacks)
+
 
 class RuleBasedClassifier:
     """基于规则的分类器
@@ -28,6 +80,9 @@ class RuleBasedClassifier:
         >>> print(result)  # "movies"
     """
 
+    # 默认规则打分结果缓存的最大条目数
+    SCORE_CACHE_SIZE = 4096
+
     # 默认启发式规则
     DEFAULT_HEURISTICS: Dict[str, List[str]] = {
         "movies": [
@@ -117,6 +172,10 @@ class RuleBasedClassifier:
         """
         self._heuristics = heuristics or self.DEFAULT_HEURISTICS
         self._compiled_patterns: Optional[Dict[str, re.Pattern]] = None
+        # 默认规则的预编译结果，规则变更时失效
+        self._compiled_rules: Optional[Dict[str, CompiledRule]] = None
+        # 默认规则下的打分结果缓存（规范化名称 -> 分数），随预编译结果一同失效
+        self._score_cache: OrderedDict[str, Dict[str, int]] = OrderedDict()
 
     def classify(
         self,
@@ -220,64 +279,106 @@ class RuleBasedClassifier:
         normalized_name = self._normalize_name(torrent_name)
         scores: Dict[str, int] = {}
 
-        for category, keywords in rules.items():
-            if category == "other" or not keywords:
-                continue
-
-            score = self._apply_rule(normalized_name, keywords)
+        if rules is self._heuristics:
+            compiled_rules = self._get_compiled_rules()
+            # 同一名称反复出现（重复复制、同系列剧集）时直接复用打分结果
+            cached = self._score_cache.get(normalized_name)
+            if cached is not None:
+                self._score_cache.move_to_end(normalized_name)
+                return dict(cached)
+        else:
+            compiled_rules = {
+                category: self._compile_keywords(keywords)
+                for category, keywords in rules.items()
+                if category != "other" and keywords
+            }
+
+        for category, compiled in compiled_rules.items():
+            score = self._apply_compiled_rule(normalized_name, compiled)
             if score > 0:
                 scores[category] = score
 
+        if rules is self._heuristics:
+            self._score_cache[normalized_name] = dict(scores)
+            if len(self._score_cache) > self.SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+
         return scores
 
-    def _apply_rule(self, normalized_name: str, keywords: List[str]) -> int:
-        """应用规则计算匹配分数
+    def _get_compiled_rules(self) -> Dict[str, CompiledRule]:
+        """获取默认规则的预编译结果（首次使用时编译）"""
+        if self._compiled_rules is None:
+            self._score_cache.clear()
+            self._compiled_rules = {
+                category: self._compile_keywords(keywords)
+                for category, keywords in self._heuristics.items()
+                if category != "other" and keywords
+            }
+        return self._compiled_rules
+
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> CompiledRule:
+        """预编译关键词列表
+
+        正则关键词只编译一次，普通关键词预先转为小写并算好权重，
+        避免每次分类都重复检查特殊字符、编译正则和转换大小写。
+        相同的关键词列表复用缓存的编译结果，调用方每次传入同一份
+        自定义分类规则时不会重复编译。
 
-        使用字符串匹配和正则表达式匹配关键词。
+        Args:
+            keywords: 关键词列表
+
+        Returns:
+            按匹配方式分组的预编译规则
+        """
+        return _compile_keyword_tuple(tuple(keywords))
+
+    @staticmethod
+    def _apply_compiled_rule(
+        normalized_name: str,
+        compiled: CompiledRule,
+    ) -> int:
+        """使用预编译的关键词计算匹配分数
 
         Args:
             normalized_name: 规范化的种子名称
-            keywords: 关键词列表
+            compiled: 预编译后的关键词
 
         Returns:
             匹配分数
         """
+        plain, regexes, fallbacks = compiled
+        # 绑定方法提升为局部变量，避免循环内重复属性查找
+        count = normalized_name.count
         score = 0
-        matched_keywords = set()
 
-        for keyword in keywords:
-            if not keyword:
-                continue
+        for keyword, weight in plain:
+            score += count(keyword) * weight
+
+        for pattern in regexes:
+            # 正则匹配权重更高
+            score += len(pattern.findall(normalized_name)) * 2
 
-            # 检查是否是正则表达式（包含特殊字符）
-            regex_special_chars = ".*+?^${}()|[]\\"
-            is_regex = any(c in keyword for c in regex_special_chars)
-
-            try:
-                if is_regex:
-                    pattern = re.compile(keyword, re.IGNORECASE)
-                    matches = list(pattern.finditer(normalized_name))
-                    if matches:
-                        score += len(matches) * 2  # 正则匹配权重更高
-                        matched_keywords.add(keyword)
-                else:
-                    # 简单的字符串匹配
-                    keyword_lower = keyword.lower()
-                    count = normalized_name.count(keyword_lower)
-                    if count > 0:
-                        # 长关键词权重更高
-                        weight = max(1, len(keyword) // 3)
-                        score += count * weight
-                        matched_keywords.add(keyword)
-            except re.error:
-                # 正则表达式错误，降级为普通字符串匹配
-                keyword_lower = keyword.lower()
-                if keyword_lower in normalized_name:
-                    score += 1
-                    matched_keywords.add(keyword)
+        for keyword in fallbacks:
+            if keyword in normalized_name:
+                score += 1
 
         return score
 
+    def _apply_rule(self, normalized_name: str, keywords: List[str]) -> int:
+        """应用规则计算匹配分数
+
+        使用字符串匹配和正则表达式匹配关键词。
+
+        Args:
+            normalized_name: 规范化的种子名称
+            keywords: 关键词列表
+
+        Returns:
+            匹配分数
+        """
+        return self._apply_compiled_rule(normalized_name, self._compile_keywords(keywords))
+
     def get_compiled_patterns(self) -> Dict[str, re.Pattern]:
         """获取预编译的正则表达式模式
 
@@ -334,6 +435,7 @@ class RuleBasedClassifier:
         self._heuristics[category].extend(keywords)
         # 清除缓存的模式，下次使用时重新编译
         self._compiled_patterns = None
+        self._compiled_rules = None
 
     def remove_rule(self, category: str) -> bool:
         """移除规则
@@ -347,6 +449,7 @@ class RuleBasedClassifier:
         if category in self._heuristics:
             del self._heuristics[category]
             self._compiled_patterns = None
+            self._compiled_rules = None
             return True
         return False
 
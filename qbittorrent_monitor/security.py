@@ -24,6 +24,21 @@ MAGNET_URI_PATTERN = re.compile(
 # 磁力链接hash提取模式
 BTIH_PATTERN = re.compile(r'btih:([a-f0-9]{40})', re.IGNORECASE)
 
+# 32位base32编码的hash（旧格式）
+BTIH_BASE32_PATTERN = re.compile(r'btih:([a-z2-7]{32})', re.IGNORECASE)
+
+# 磁力链接允许的字符
+MAGNET_ALLOWED_CHARS_PATTERN = re.compile(r'^[a-zA-Z0-9\-._~:/?#[\]@!$&\'()*+,;=]+$', re.ASCII)
+
+# 控制字符（ASCII < 32），磁力链接解码后不允许出现，清理时移除
+CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x1f]')
+
+# 磁力链接参数键名
+MAGNET_PARAM_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)=')
+
+# 允许的标准磁力链接参数
+VALID_MAGNET_PARAMS = frozenset({'xt', 'dn', 'tr', 'xl', 'as', 'xs', 'kt', 'mt', 'so'})
+
 # 磁力链接最小长度
 MIN_MAGNET_LENGTH = 50
 
@@ -57,8 +72,7 @@ def validate_magnet(magnet: str) -> Tuple[bool, Optional[str]]:
     # 验证 xt 参数存在且格式正确（40位十六进制或32位base32）
     if not MAGNET_URI_PATTERN.match(magnet):
         # 检查是否是32位base32编码的hash（旧格式）
-        base32_pattern = re.compile(r'btih:([a-z2-7]{32})', re.IGNORECASE)
-        if base32_pattern.search(magnet):
+        if BTIH_BASE32_PATTERN.search(magnet):
             # 继续执行后续验证
             pass
         else:
@@ -68,24 +82,21 @@ def validate_magnet(magnet: str) -> Tuple[bool, Optional[str]]:
     try:
         from urllib.parse import unquote
         decoded = unquote(magnet)
-        # 检查是否包含控制字符
-        if any(ord(c) < 32 for c in decoded):
+        # 检查是否包含控制字符（search 在首个命中处停止，扫描在 C 层完成）
+        if CONTROL_CHARS_PATTERN.search(decoded):
             return False, "磁力链接包含非法字符"
     except Exception:
         return False, "磁力链接编码错误"
     
     # 安全增强：验证磁力链接只包含允许的字符
-    allowed_pattern = re.compile(r'^[a-zA-Z0-9\-._~:/?#[\]@!$&\'()*+,;=]+$', re.ASCII)
-    if not allowed_pattern.match(magnet):
+    if not MAGNET_ALLOWED_CHARS_PATTERN.match(magnet):
         return False, "磁力链接包含非法字符"
     
     # 安全增强：验证参数键名安全
-    param_pattern = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)=')
-    for match in param_pattern.finditer(magnet):
+    for match in MAGNET_PARAM_PATTERN.finditer(magnet):
         param_name = match.group(1)
         # 只允许标准磁力链接参数
-        valid_params = {'xt', 'dn', 'tr', 'xl', 'as', 'xs', 'kt', 'mt', 'so'}
-        if param_name not in valid_params:
+        if param_name not in VALID_MAGNET_PARAMS:
             return False, f"不支持的参数: {param_name}"
     
     return True, None
@@ -108,7 +119,7 @@ def sanitize_magnet(magnet: str) -> str:
     magnet = magnet[:MAX_MAGNET_LENGTH]
     
     # 移除控制字符和空白字符
-    magnet = ''.join(c for c in magnet if ord(c) >= 32 and c not in '\n\r\t')
+    magnet = CONTROL_CHARS_PATTERN.sub('', magnet)
     
     # 统一为小写的协议部分
     if magnet.lower().startswith('magnet:?'):
@@ -136,8 +147,7 @@ def extract_magnet_hash_safe(magnet: str) -> Optional[str]:
         return match.group(1).lower()
     
     # 尝试匹配32位base32（转换为40位十六进制需要解码）
-    base32_pattern = re.compile(r'btih:([a-z2-7]{32})', re.IGNORECASE)
-    match = base32_pattern.search(magnet)
+    match = BTIH_BASE32_PATTERN.search(magnet)
     if match:
         # 返回原始hash，不做base32解码
         return match.group(1).lower()
@@ -230,7 +240,7 @@ def sanitize_filename(filename: str) -> str:
         return "unnamed"
     
     # 移除控制字符
-    filename = ''.join(c for c in filename if ord(c) >= 32)
+    filename = CONTROL_CHARS_PATTERN.sub('', filename)
     
     # 替换非法字符
     filename = ILLEGAL_PATH_CHARS.sub('_', filename)
@@ -354,6 +364,12 @@ SENSITIVE_FIELD_PATTERNS = [
     re.compile(r'auth', re.IGNORECASE),
 ]
 
+# 合并为单个交替正则，一次扫描即可判断
+SENSITIVE_FIELD_REGEX = re.compile(
+    '|'.join(f'(?:{p.pattern})' for p in SENSITIVE_FIELD_PATTERNS),
+    re.IGNORECASE
+)
+
 
 def is_sensitive_field(field_name: str) -> bool:
     """
@@ -365,10 +381,7 @@ def is_sensitive_field(field_name: str) -> bool:
     Returns:
         是否为敏感字段
     """
-    for pattern in SENSITIVE_FIELD_PATTERNS:
-        if pattern.search(field_name):
-            return True
-    return False
+    return SENSITIVE_FIELD_REGEX.search(field_name) is not None
 
 
 def mask_sensitive_value(value: str, visible_chars: int = 3) -> str:
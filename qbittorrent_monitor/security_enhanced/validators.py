@@ -178,19 +178,21 @@ class LogSecuritySanitizer:
         return template % safe_args
 
 
+# 异常信息中的敏感模式（模块级预编译，避免每次调用重新构建）
+_EXCEPTION_SENSITIVE_PATTERNS = (
+    (re.compile(r'(password["\']?\s*[:=]\s*["\']?)[^\s"\']+', re.I), r'\1***'),
+    (re.compile(r'(api[_-]?key["\']?\s*[:=]\s*["\']?)[^\s"\']+', re.I), r'\1***'),
+    (re.compile(r'(/[^/]+/){0,3}\.config/[^/]+', re.I), r'/.../.config/***'),
+    (re.compile(r'(/[^/]+/){0,3}\.local/[^/]+', re.I), r'/.../.local/***'),
+)
+
+
 def sanitize_exception(exc: Exception) -> str:
     """清理异常信息中的敏感数据"""
     exc_str = str(exc)
     
     # 移除敏感模式
-    patterns = [
-        (re.compile(r'(password["\']?\s*[:=]\s*["\']?)[^\s"\']+', re.I), r'\1***'),
-        (re.compile(r'(api[_-]?key["\']?\s*[:=]\s*["\']?)[^\s"\']+', re.I), r'\1***'),
-        (re.compile(r'(/[^/]+/){0,3}\.config/[^/]+'), r'/.../.config/***'),
-        (re.compile(r'(/[^/]+/){0,3}\.local/[^/]+'), r'/.../.local/***'),
-    ]
-    
-    for pattern, replacement in patterns:
-        exc_str = re.sub(pattern, replacement, exc_str, flags=re.I)
+    for pattern, replacement in _EXCEPTION_SENSITIVE_PATTERNS:
+        exc_str = pattern.sub(replacement, exc_str)
     
     return exc_str
@@ -5,19 +5,23 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
 from typing import Dict, Optional
 from collections import OrderedDict
 
+from ..optimized_hash import hash_int
+
 logger = logging.getLogger(__name__)
 
+# 可缓存内容的最大字节数（10MB）
+_MAX_CONTENT_BYTES = 10 * 1024 * 1024
+
 
 class ClipboardCache:
     """剪贴板内容哈希缓存 - 避免重复解析
     
-    使用 MD5 哈希（缓存场景不需要加密安全）以获得更好性能。
+    使用 64 位非加密哈希作为整数键（缓存场景不需要加密安全）以获得更好性能。
     添加内存限制防止内存泄漏，使用 LRU 策略。
     
     Attributes:
@@ -39,37 +43,35 @@ class ClipboardCache:
             max_size: 最大缓存条目数
             max_memory_mb: 最大内存使用（MB）
         """
-        self._cache: OrderedDict[str, str] = OrderedDict()  # LRU 缓存
+        self._cache: OrderedDict[int, str] = OrderedDict()  # LRU 缓存
         self._max_size = max_size
         self._max_memory_bytes = max_memory_mb * 1024 * 1024
         self._total_content_size = 0
         
         # 访问时间跟踪（用于 LRU）
-        self._access_times: Dict[str, float] = {}
+        self._access_times: Dict[int, float] = {}
         
         # 统计
         self._hits = 0
         self._misses = 0
 
-    def _compute_hash(self, content: str) -> str:
+    def _compute_hash(self, content: str) -> int:
         """计算内容哈希
         
-        使用 MD5（性能优化，缓存场景安全）。
+        使用 xxHash / BLAKE2b 的 64 位整数摘要（性能优化，缓存场景安全）。
         短内容直接哈希，长内容使用采样哈希。
         
         Args:
             content: 内容字符串
             
         Returns:
-            哈希字符串
+            64 位整数哈希
         """
         if len(content) <= 1000:
-            return hashlib.md5(content.encode('utf-8')).hexdigest()
+            return hash_int(content.encode('utf-8'))
         
-        # 长内容：哈希前1KB + 长度作为指纹
-        return hashlib.md5(
-            content[:1000].encode('utf-8') + str(len(content)).encode()
-        ).hexdigest()
+        # 长内容：哈希前1KB，长度作为种子参与指纹（无需再拼接字节串）
+        return hash_int(content[:1000].encode('utf-8'), seed=len(content))
 
     def get(self, content: str) -> Optional[str]:
         """获取缓存的哈希，如果存在则更新访问时间
@@ -99,11 +101,16 @@ class ClipboardCache:
             content: 原始内容
             result_hash: 结果哈希
         """
-        # 检查内容大小
-        content_size = len(content.encode('utf-8'))
-        if content_size > 10 * 1024 * 1024:  # 10MB 限制
-            logger.debug(f"剪贴板内容过大 ({content_size} 字节)，跳过缓存")
-            return
+        # 检查内容大小：UTF-8 每字符 1-4 字节，只有无法仅凭字符数
+        # 判断时才编码计算实际字节数
+        if len(content) * 4 > _MAX_CONTENT_BYTES:
+            content_size = (
+                len(content) if len(content) > _MAX_CONTENT_BYTES
+                else len(content.encode('utf-8'))
+            )
+            if content_size > _MAX_CONTENT_BYTES:
+                logger.debug(f"剪贴板内容过大 (≥{content_size} 字节)，跳过缓存")
+                return
         
         content_hash = self._compute_hash(content)
         
@@ -135,7 +142,7 @@ class ClipboardCache:
         self._total_content_size -= len(oldest_value.encode('utf-8'))
         del self._access_times[oldest_hash]
         
-        logger.debug(f"淘汰缓存项: {oldest_hash[:16]}...")
+        logger.debug("淘汰缓存项: %016x", oldest_hash)
 
     def clear(self) -> None:
         """清空缓存"""
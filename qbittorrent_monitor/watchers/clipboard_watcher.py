@@ -10,13 +10,17 @@ import hashlib
 import logging
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Set
-from datetime import datetime
+from typing import Callable, Dict, List, Optional
 
 import pyperclip
 
 logger = logging.getLogger(__name__)
 
+# 超过此长度的内容只对首尾采样计算哈希
+_HASH_FULL_MAX_CHARS = 1024
+_HASH_HEAD_CHARS = 512
+_HASH_TAIL_CHARS = 64
+
 
 @dataclass
 class ClipboardEvent:
@@ -76,7 +80,6 @@ class ClipboardWatcher:
         
         # 状态跟踪
         self._last_content: str = ""
-        self._last_hash: str = ""
         self._last_change_time: float = 0.0
         self._change_count: int = 0
         
@@ -146,18 +149,13 @@ class ClipboardWatcher:
                 self._stats["empty_skips"] += 1
                 return
             
-            # 快速字符串比较
+            # 快速字符串比较（内容相同则无需计算哈希）
             if content == self._last_content:
                 return
             
-            # 计算哈希
+            # 内容已确认变化，哈希仅用于事件标识
             content_hash = self._compute_hash(content)
             
-            # 如果哈希相同，跳过
-            if content_hash == self._last_hash:
-                self._last_content = content  # 更新内容避免重复计算哈希
-                return
-            
             # 检测连续变化
             now = time.time()
             if now - self._last_change_time < 5.0:  # 5秒内算连续变化
@@ -167,7 +165,6 @@ class ClipboardWatcher:
             
             # 更新状态
             self._last_content = content
-            self._last_hash = content_hash
             self._last_change_time = now
             self._stats["changes"] += 1
             
@@ -229,15 +226,26 @@ class ClipboardWatcher:
     def _compute_hash(self, content: str) -> str:
         """计算内容哈希
         
-        使用 MD5 获得更好性能（监控场景不需要加密安全）。
+        使用 128 位 BLAKE2b：比 MD5 更快，输出长度与原先一致（32 位十六进制）。
+        长内容（如包含磁力链接的大段 HTML）只哈希首尾采样，并以总长度作为
+        salt 参与指纹，哈希开销与剪贴板大小无关。内容是否变化由调用方的
+        字符串比较判定，哈希仅作为事件标识。
         
         Args:
             content: 内容字符串
             
         Returns:
-            MD5 哈希字符串
+            BLAKE2b-128 哈希字符串
         """
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        if len(content) <= _HASH_FULL_MAX_CHARS:
+            return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+        
+        sample = content[:_HASH_HEAD_CHARS] + content[-_HASH_TAIL_CHARS:]
+        return hashlib.blake2b(
+            sample.encode('utf-8'),
+            digest_size=16,
+            salt=len(content).to_bytes(hashlib.blake2b.SALT_SIZE, 'little'),
+        ).hexdigest()
 
     def get_stats(self) -> Dict[str, int]:
         """获取统计信息
@@ -319,11 +327,10 @@ class SmartClipboardWatcher(ClipboardWatcher):
                 
                 await self._check_once()
                 
-                # 计算下次检查间隔
-                self._update_interval()
-                
-                # 计算需要等待的时间
-                elapsed = time.time() - start_time
+                # 计算下次检查间隔与需要等待的时间（共用同一时间戳）
+                now = time.time()
+                self._update_interval(now)
+                elapsed = now - start_time
                 wait_time = max(0, self._current_interval - elapsed)
                 
                 if wait_time > 0:
@@ -335,9 +342,14 @@ class SmartClipboardWatcher(ClipboardWatcher):
             self._running = False
             logger.info("智能剪贴板观察器已停止")
 
-    def _update_interval(self) -> None:
-        """根据活动状态更新检查间隔"""
-        now = time.time()
+    def _update_interval(self, now: Optional[float] = None) -> None:
+        """根据活动状态更新检查间隔
+        
+        Args:
+            now: 当前时间戳，默认取 time.time()
+        """
+        if now is None:
+            now = time.time()
         time_since_last_change = now - self._last_change_time
         
         if time_since_last_change > self.idle_threshold:
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Set
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ class DebounceFilter:
     
     防止在指定时间窗口内重复处理相同的磁力链接。
     使用滑动窗口机制，自动清理过期的记录。
+    记录按最后出现时间排序（OrderedDict），清理时只需从头部弹出过期项。
     
     Attributes:
         debounce_seconds: 防抖时间窗口（秒）
@@ -43,7 +45,8 @@ class DebounceFilter:
         """
         self.debounce_seconds = debounce_seconds
         self.cleanup_multiplier = cleanup_multiplier
-        self._pending: Dict[str, float] = {}  # hash -> timestamp
+        # hash -> timestamp，按时间从旧到新排列
+        self._pending: OrderedDict[str, float] = OrderedDict()
         self._stats = {
             "debounced": 0,
             "passed": 0,
@@ -65,16 +68,16 @@ class DebounceFilter:
             last_seen = self._pending[content_hash]
             if now - last_seen < self.debounce_seconds:
                 self._stats["debounced"] += 1
-                logger.debug(f"内容在防抖窗口内，跳过: {content_hash[:16]}...")
+                logger.debug("内容在防抖窗口内，跳过: %s...", content_hash[:16])
                 return True
         
-        # 更新时间戳
+        # 更新时间戳并移到队尾，保持按时间排序
         self._pending[content_hash] = now
+        self._pending.move_to_end(content_hash)
         self._stats["passed"] += 1
         
-        # 定期清理
-        if self._should_cleanup():
-            self.cleanup()
+        # 清理只弹出队首过期项，摊销 O(1)，可每次执行
+        self.cleanup(now)
         
         return False
 
@@ -85,30 +88,37 @@ class DebounceFilter:
             content_hash: 内容哈希
         """
         self._pending[content_hash] = time.time()
+        self._pending.move_to_end(content_hash)
 
-    def cleanup(self) -> int:
+    def cleanup(self, now: Optional[float] = None) -> int:
         """清理过期的防抖记录
         
+        记录按时间排序，遇到第一条未过期记录即可停止。
+        
+        Args:
+            now: 当前时间戳，默认取 time.time()
+        
         Returns:
             清理的记录数量
         """
-        now = time.time()
+        if now is None:
+            now = time.time()
         threshold = self.debounce_seconds * self.cleanup_multiplier
+        pending = self._pending
         
-        expired = [
-            h for h, ts in self._pending.items()
-            if now - ts > threshold
-        ]
-        
-        for h in expired:
-            del self._pending[h]
-        
-        self._stats["cleaned"] += len(expired)
+        expired = 0
+        while pending:
+            ts = next(iter(pending.values()))
+            if now - ts <= threshold:
+                break
+            pending.popitem(last=False)
+            expired += 1
         
         if expired:
-            logger.debug(f"清理 {len(expired)} 条过期防抖记录")
+            self._stats["cleaned"] += expired
+            logger.debug(f"清理 {expired} 条过期防抖记录")
         
-        return len(expired)
+        return expired
 
     def clear(self) -> None:
         """清空所有防抖记录"""
@@ -126,12 +136,6 @@ class DebounceFilter:
             "pending_count": len(self._pending),
         }
 
-    def _should_cleanup(self) -> bool:
-        """检查是否应该执行清理"""
-        # 每100次检查清理一次
-        total_checks = self._stats["debounced"] + self._stats["passed"]
-        return total_checks > 0 and total_checks % 100 == 0
-
     def set_debounce_seconds(self, seconds: float) -> None:
         """动态设置防抖时间
         
@@ -1,20 +1,30 @@
 """FastAPI 应用主文件"""
 
 import asyncio
-import json
 import logging
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, field
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Set
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
+from fastapi import FastAPI, WebSocket
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.cors import CORSMiddleware
 
-from ..config import Config, load_config
+# orjson 可选：安装后 API 响应使用 C 实现的 JSON 编码
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+    ORJSON_AVAILABLE = False
+
+from ..config import Config
 from ..qb_client import QBClient
 from ..monitor import ClipboardMonitor
 from ..classifier import ContentClassifier
@@ -23,31 +33,79 @@ from ..security import validate_magnet, sanitize_magnet
 
 logger = logging.getLogger(__name__)
 
+# 路由中实际用到的 HTTP 方法，CORS 预检只需放行这些
+CORS_ALLOW_METHODS = ["GET", "POST", "DELETE"]
+
 
-@dataclass
 class MagnetHistoryItem:
     """历史记录项"""
-    magnet: str
-    hash: str
-    category: str
-    display_name: str
-    timestamp: datetime
-    status: str  # "success", "failed", "pending"
-    error_message: Optional[str] = None
+    
+    __slots__ = (
+        "magnet", "hash", "category", "display_name", "timestamp", "status", "error_message",
+    )
+    
+    def __init__(
+        self,
+        magnet: str,
+        hash: str,
+        category: str,
+        display_name: str,
+        timestamp: float,  # time.time()，序列化时再格式化为 ISO 字符串
+        status: str,  # "success", "failed", "pending"
+        error_message: Optional[str] = None,
+    ):
+        self.magnet = magnet
+        self.hash = hash
+        self.category = category
+        self.display_name = display_name
+        self.timestamp = timestamp
+        self.status = status
+        self.error_message = error_message
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 格式的时间戳"""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可 JSON 序列化的字典（不含原始磁力链接）"""
+        return {
+            "hash": self.hash,
+            "category": self.category,
+            "display_name": self.display_name,
+            "timestamp": self.timestamp_iso,
+            "status": self.status,
+            "error_message": self.error_message,
+        }
 
 
-@dataclass
 class LogEntry:
     """日志条目"""
-    timestamp: str
-    level: str
-    message: str
-    source: str = ""
+    
+    __slots__ = ("timestamp", "level", "message", "source")
+    
+    def __init__(self, timestamp: str, level: str, message: str, source: str = ""):
+        self.timestamp = timestamp
+        self.level = level
+        self.message = message
+        self.source = source
+    
+    def to_dict(self) -> Dict[str, str]:
+        """转换为可 JSON 序列化的字典"""
+        return {
+            "timestamp": self.timestamp,
+            "level": self.level,
+            "message": self.message,
+            "source": self.source,
+        }
 
 
 class WebMonitor:
     """Web 监控器 - 管理状态和 WebSocket 连接"""
     
+    # 启动监控时连接 qBittorrent 的最长等待时间（秒）
+    QB_CONNECT_TIMEOUT = 15.0
+    
     def __init__(self, config: Config):
         self.config = config
         self.qb_client: Optional[QBClient] = None
@@ -55,13 +113,17 @@ class WebMonitor:
         self.classifier: Optional[ContentClassifier] = None
         
         # 历史记录
-        self.history: List[MagnetHistoryItem] = []
         self.max_history = 1000
+        self.history: Deque[MagnetHistoryItem] = deque(maxlen=self.max_history)
         
-        # 日志队列
-        self.logs: asyncio.Queue = asyncio.Queue(maxsize=500)
-        self.recent_logs: List[LogEntry] = []
+        # 日志缓冲
         self.max_logs = 200
+        self.recent_logs: Deque[LogEntry] = deque(maxlen=self.max_logs)
+        # 待处理日志环形缓冲，由单个排空任务批量处理，避免每条日志创建一个任务；
+        # 积压超过上限时自动丢弃最旧的条目
+        self.max_pending_logs = 500
+        self._pending_logs: Deque[LogEntry] = deque(maxlen=self.max_pending_logs)
+        self._log_drain_task: Optional[asyncio.Task] = None
         
         # WebSocket 连接管理
         self.active_connections: Set[WebSocket] = set()
@@ -70,6 +132,9 @@ class WebMonitor:
         self.is_running = False
         self._monitor_task: Optional[asyncio.Task] = None
         
+        # 后台任务（日志/历史广播、统计循环），完成后自动移除
+        self._background_tasks: Set[asyncio.Task] = set()
+        
         # 日志处理器
         self._setup_logging()
     
@@ -79,17 +144,27 @@ class WebMonitor:
             def __init__(self, web_monitor: 'WebMonitor'):
                 super().__init__()
                 self.web_monitor = web_monitor
+                # (秒, 已格式化的时间)，同一秒内的记录直接复用
+                self._cached_second = (-1, "")
+            
+            def _format_time(self, created: float) -> str:
+                second = int(created)
+                cached_second, text = self._cached_second
+                if second != cached_second:
+                    text = time.strftime("%H:%M:%S", time.localtime(second))
+                    self._cached_second = (second, text)
+                return text
             
             def emit(self, record):
                 try:
                     entry = LogEntry(
-                        timestamp=datetime.fromtimestamp(record.created).strftime("%H:%M:%S"),
+                        timestamp=self._format_time(record.created),
                         level=record.levelname,
                         message=self.format(record),
                         source=record.name
                     )
-                    # 异步添加到队列
-                    asyncio.create_task(self.web_monitor._add_log(entry))
+                    # 加入待处理缓冲，由排空任务批量添加
+                    self.web_monitor._enqueue_log(entry)
                 except Exception:
                     pass
         
@@ -101,18 +176,38 @@ class WebMonitor:
         # 添加到根日志记录器
         logging.getLogger().addHandler(handler)
     
+    def _spawn(self, coro) -> asyncio.Task:
+        """创建并跟踪后台任务
+        
+        持有任务的强引用，避免被垃圾回收；任务结束后自动从集合中移除。
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    def _enqueue_log(self, entry: LogEntry) -> None:
+        """缓冲日志条目，必要时调度排空任务
+        
+        同一批日志共享一个后台任务，高频日志时不再为每条记录创建任务。
+        """
+        if self._log_drain_task is None or self._log_drain_task.done():
+            self._log_drain_task = self._spawn(self._drain_logs())
+        self._pending_logs.append(entry)
+    
+    async def _drain_logs(self):
+        """批量排空待处理日志"""
+        pending = self._pending_logs
+        while pending:
+            await self._add_log(pending.popleft())
+    
     async def _add_log(self, entry: LogEntry):
         """添加日志条目"""
-        try:
-            self.logs.put_nowait(entry)
-            self.recent_logs.append(entry)
-            if len(self.recent_logs) > self.max_logs:
-                self.recent_logs.pop(0)
-            
-            # 广播给所有 WebSocket 连接
-            await self.broadcast_log(entry)
-        except asyncio.QueueFull:
-            pass
+        # deque 设置了 maxlen，追加时自动淘汰最旧的条目
+        self.recent_logs.append(entry)
+        
+        # 广播给所有 WebSocket 连接
+        await self.broadcast_log(entry)
     
     async def connect(self, websocket: WebSocket):
         """WebSocket 连接处理"""
@@ -135,12 +230,7 @@ class WebMonitor:
         
         message = {
             "type": "log",
-            "data": {
-                "timestamp": entry.timestamp,
-                "level": entry.level,
-                "message": entry.message,
-                "source": entry.source
-            }
+            "data": entry.to_dict()
         }
         
         disconnected = set()
@@ -196,14 +286,12 @@ class WebMonitor:
         
         try:
             self.qb_client = QBClient(self.config)
-            await self.qb_client.__aenter__()
-            
-            version = await self.qb_client.get_version()
+            version = await asyncio.wait_for(
+                self._connect_qbittorrent(self.qb_client),
+                timeout=self.QB_CONNECT_TIMEOUT
+            )
             logger.info(f"qBittorrent 连接成功 (版本: {version})")
             
-            # 确保分类存在
-            await self.qb_client.ensure_categories()
-            
             self.classifier = ContentClassifier(self.config)
             self.monitor = ClipboardMonitor(self.qb_client, self.config, self.classifier)
             
@@ -215,13 +303,37 @@ class WebMonitor:
             self.is_running = True
             
             # 启动统计广播任务
-            asyncio.create_task(self._broadcast_stats_loop())
+            self._spawn(self._broadcast_stats_loop())
             
             return True, f"监控已启动 (qBittorrent {version})"
+        except asyncio.TimeoutError:
+            logger.error(f"连接 qBittorrent 超时 ({self.QB_CONNECT_TIMEOUT:.0f}s)")
+            await self._close_qb_client()
+            return False, "连接 qBittorrent 超时"
         except Exception as e:
             logger.error(f"启动监控失败: {e}")
+            await self._close_qb_client()
             return False, str(e)
     
+    @staticmethod
+    async def _connect_qbittorrent(qb_client: QBClient) -> str:
+        """登录 qBittorrent、确保分类存在，返回版本号"""
+        await qb_client.__aenter__()
+        version = await qb_client.get_version()
+        
+        # 确保分类存在
+        await qb_client.ensure_categories()
+        return version
+    
+    async def _close_qb_client(self) -> None:
+        """关闭 qBittorrent 客户端（启动失败时释放会话）"""
+        if self.qb_client:
+            try:
+                await self.qb_client.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"关闭 qBittorrent 客户端失败: {e}")
+            self.qb_client = None
+    
     async def stop_monitor(self):
         """停止剪贴板监控"""
         if not self.is_running:
@@ -233,13 +345,21 @@ class WebMonitor:
             if self.monitor:
                 self.monitor.stop()
             
+            # 先统一取消，再一次性等待所有任务结束
+            pending = [t for t in self._background_tasks if not t.done()]
             if self._monitor_task:
-                self._monitor_task.cancel()
-                try:
-                    await self._monitor_task
-                except asyncio.CancelledError:
-                    pass
+                pending.append(self._monitor_task)
                 self._monitor_task = None
+            for task in pending:
+                task.cancel()
+            if pending:
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(*pending, return_exceptions=True),
+                        timeout=2.0
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning("部分后台任务未能在超时时间内结束")
             
             if self.qb_client:
                 await self.qb_client.__aexit__(None, None, None)
@@ -267,7 +387,7 @@ class WebMonitor:
             hash=magnet_hash,
             category=category or "unknown",
             display_name=display_name,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             status="pending"
         )
         self._add_history(history_item)
@@ -321,19 +441,18 @@ class WebMonitor:
             hash=magnet_hash,
             category=category,
             display_name=display_name,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             status="success"
         )
         self._add_history(history_item)
     
     def _add_history(self, item: MagnetHistoryItem):
         """添加历史记录"""
-        self.history.insert(0, item)
-        if len(self.history) > self.max_history:
-            self.history.pop()
+        # 最新的在前；超出 maxlen 时自动丢弃最旧的记录
+        self.history.appendleft(item)
         
         # 广播历史更新
-        asyncio.create_task(self.broadcast_history_update(item))
+        self._spawn(self.broadcast_history_update(item))
     
     async def broadcast_history_update(self, item: MagnetHistoryItem):
         """广播历史记录更新"""
@@ -342,7 +461,7 @@ class WebMonitor:
         
         message = {
             "type": "history_update",
-            "data": self._history_item_to_dict(item)
+            "data": item.to_dict()
         }
         
         disconnected = set()
@@ -356,8 +475,11 @@ class WebMonitor:
             self.active_connections.discard(conn)
     
     def get_stats(self) -> Dict[str, Any]:
-        """获取统计信息"""
-        monitor_stats = self.monitor.get_stats() if self.monitor else {}
+        """获取统计信息
+        
+        只需要基础计数，直接读取 MonitorStats，不生成去抖/限流/缓存等子统计。
+        """
+        monitor_stats = self.monitor.stats.to_dict() if self.monitor else {}
         
         return {
             "is_running": self.is_running,
@@ -372,23 +494,18 @@ class WebMonitor:
             "checks_per_minute": monitor_stats.get("checks_per_minute", 0),
             "avg_check_time_ms": monitor_stats.get("avg_check_time_ms", 0),
             "history_count": len(self.history),
+            "ai_status": self.classifier.get_ai_status()["status"] if self.classifier else "disabled",
         }
     
     def get_history(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """获取历史记录"""
-        items = self.history[offset:offset + limit]
-        return [self._history_item_to_dict(item) for item in items]
+        """获取历史记录（最新的在前）"""
+        offset = max(0, offset)
+        limit = max(0, min(limit, self.max_history))
+        return [item.to_dict() for item in islice(self.history, offset, offset + limit)]
     
-    def _history_item_to_dict(self, item: MagnetHistoryItem) -> Dict[str, Any]:
-        """历史记录项转字典"""
-        return {
-            "hash": item.hash,
-            "category": item.category,
-            "display_name": item.display_name,
-            "timestamp": item.timestamp.isoformat(),
-            "status": item.status,
-            "error_message": item.error_message
-        }
+    def get_recent_logs(self, limit: int = 100) -> List[Dict[str, str]]:
+        """获取最近的日志（最新的在前）"""
+        return [log.to_dict() for log in islice(reversed(self.recent_logs), limit)]
     
     def get_categories(self) -> Dict[str, Any]:
         """获取分类配置"""
@@ -533,15 +650,16 @@ def create_app(config: Config) -> FastAPI:
         title="qBittorrent Clipboard Monitor",
         description="qBittorrent 剪贴板监控 Web 管理界面",
         version="3.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=DefaultJSONResponse,
     )
     
-    # CORS 中间件
+    # CORS 中间件（只放行路由实际使用的方法）
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=CORS_ALLOW_METHODS,
         allow_headers=["*"],
     )
     
@@ -226,18 +226,8 @@ def register_routes(app: FastAPI, templates: Jinja2Templates):
                 content={"error": "服务不可用"}
             )
         
-        logs = monitor.recent_logs[-limit:] if monitor.recent_logs else []
-        
         return {
-            "logs": [
-                {
-                    "timestamp": log.timestamp,
-                    "level": log.level,
-                    "message": log.message,
-                    "source": log.source
-                }
-                for log in reversed(logs)
-            ]
+            "logs": monitor.get_recent_logs(limit)
         }
     
     @app.post("/api/control/start")
@@ -315,18 +305,9 @@ def register_routes(app: FastAPI, templates: Jinja2Templates):
                 # 处理命令
                 if data.get("action") == "get_logs":
                     # 发送最近的日志
-                    logs = monitor.recent_logs[-50:] if monitor.recent_logs else []
                     await websocket.send_json({
                         "type": "logs",
-                        "data": [
-                            {
-                                "timestamp": log.timestamp,
-                                "level": log.level,
-                                "message": log.message,
-                                "source": log.source
-                            }
-                            for log in reversed(logs)
-                        ]
+                        "data": monitor.get_recent_logs(50)
                     })
                 elif data.get("action") == "ping":
                     await websocket.send_json({"type": "pong"})
@@ -250,6 +250,71 @@ class TestRetryWithBackoff:
         assert retry_calls[0][0] == "ValueError"
         assert retry_calls[0][1] == 1
 
+    
+    @pytest.mark.asyncio
+    async def test_programming_errors_not_retried(self):
+        """测试编程错误默认不重试"""
+        call_count = 0
+        
+        @retry_with_backoff(max_retries=3, base_delay=0.01)
+        async def buggy_func():
+            nonlocal call_count
+            call_count += 1
+            raise TypeError("参数错误")
+        
+        with pytest.raises(TypeError):
+            await buggy_func()
+        
+        assert call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_programming_errors_retried_when_listed(self):
+        """测试显式指定时仍可重试编程错误"""
+        call_count = 0
+        
+        @retry_with_backoff(max_retries=2, base_delay=0.01, retry_on=(TypeError,))
+        async def buggy_func():
+            nonlocal call_count
+            call_count += 1
+            raise TypeError("参数错误")
+        
+        with pytest.raises(TypeError):
+            await buggy_func()
+        
+        assert call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_fail_fast_on_repeated_error(self):
+        """测试连续相同错误时提前放弃"""
+        call_count = 0
+        
+        @retry_with_backoff(max_retries=5, base_delay=0.01, fail_fast_on_repeat=True)
+        async def fail_func():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("失败")
+        
+        with pytest.raises(ValueError):
+            await fail_func()
+        
+        assert call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_fail_fast_keeps_retrying_distinct_errors(self):
+        """测试错误不同时继续重试"""
+        call_count = 0
+        
+        @retry_with_backoff(max_retries=3, base_delay=0.01, fail_fast_on_repeat=True)
+        async def flaky_func():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ValueError(f"失败 {call_count}")
+            return "success"
+        
+        assert await flaky_func() == "success"
+        assert call_count == 3
+
 
 class TestLogExecutionTime:
     """测试执行时间日志装饰器"""
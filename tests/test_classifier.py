@@ -5,6 +5,7 @@ import asyncio
 
 from qbittorrent_monitor.classifier import ContentClassifier, ClassificationResult, LRUCache
 from qbittorrent_monitor.config import Config, CategoryConfig
+from qbittorrent_monitor.performance.trie_classifier import TrieClassifier
 
 
 def run_async(coro, event_loop):
@@ -59,6 +60,17 @@ class TestContentClassifier:
         assert result.category == "movies"
         assert result.method == "rule"
     
+    def test_classify_by_extension(self, mock_config, event_loop):
+        """测试按文件扩展名快速分类"""
+        classifier = ContentClassifier(mock_config)
+
+        result = run_async(classifier.classify("Some.Artist-Track.FLAC"), event_loop)
+        assert result.category == "music"
+        assert result.method == "rule"
+
+        # 视频容器扩展名含义不明确，不走扩展名快速分类
+        assert classifier._extension_classify("show.s01e01.mkv") is None
+
     def test_classify_caching(self, mock_config, event_loop):
         """测试分类缓存功能"""
         classifier = ContentClassifier(mock_config)
@@ -121,6 +133,23 @@ class TestContentClassifier:
         results = run_async(classifier.classify_batch([]), event_loop)
         assert results == []
     
+    def test_ai_status_without_probe(self, mock_config):
+        """测试 AI 健康状态仅依据调用记录"""
+        classifier = ContentClassifier(mock_config)
+        assert classifier.get_ai_status()["status"] == "disabled"
+        
+        classifier.client = object()
+        classifier.ai_config.enabled = True
+        assert classifier.get_ai_status()["status"] == "unknown"
+        
+        classifier._last_ai_success = 100.0
+        assert classifier.get_ai_status()["status"] == "healthy"
+        
+        classifier._last_ai_failure = 200.0
+        status = classifier.get_ai_status()
+        assert status["status"] == "degraded"
+        assert status["last_failure_age"] < status["last_success_age"]
+    
     def test_cache_clear(self, mock_config):
         """测试清空缓存"""
         classifier = ContentClassifier(mock_config)
@@ -182,6 +211,17 @@ class TestContentClassifier:
         assert "PDF" in classifier._keywords["books"]
         assert "EPUB" in classifier._keywords["books"]
 
+    def test_config_keywords_do_not_leak_into_defaults(self, mock_config):
+        """测试配置关键词不会写入类级别默认关键词"""
+        mock_config.categories["movies"].keywords = ["Custom", "custom"]
+        defaults_before = list(ContentClassifier.DEFAULT_KEYWORDS["movies"])
+
+        classifier = ContentClassifier(mock_config)
+
+        assert classifier._keywords["movies"].count("Custom") == 1
+        assert "custom" not in classifier._keywords["movies"]
+        assert ContentClassifier.DEFAULT_KEYWORDS["movies"] == defaults_before
+
 
 class TestLRUCache:
     """测试 LRU 缓存"""
@@ -277,3 +317,40 @@ class TestClassificationResult:
         
         assert result1.category == result2.category
         assert result1.category != result3.category
+
+
+class TestTrieClassifier:
+    """测试 Trie 分类器"""
+    
+    def test_automaton_matches_trie_walk(self):
+        """测试 Aho-Corasick 自动机与 Trie 遍历的匹配结果一致"""
+        pytest.importorskip("ahocorasick")
+        
+        classifier = TrieClassifier({
+            "movies": ["1080p", "BluRay", "Ray", "x264"],
+            "tv": ["S01", "S01E01", "HDTV"],
+            "anime": ["BD", "1080p", "Raws"],
+            "other": ["ignored"],
+        })
+        automaton = classifier._automaton
+        assert automaton is not None
+        
+        texts = [
+            "Show.S01E01.1080p.HDTV.x264",
+            "[Raws] Anime BD 1080p BluRay",
+            "rayray s01s01e01",
+            "nothing ignored here",
+            "",
+        ]
+        for text in texts:
+            automaton_matches = [
+                (m.keyword, m.category, m.position) for m in classifier._search(text)
+            ]
+            classifier._automaton = None
+            try:
+                walk_matches = [
+                    (m.keyword, m.category, m.position) for m in classifier._search(text)
+                ]
+            finally:
+                classifier._automaton = automaton
+            assert automaton_matches == walk_matches, text
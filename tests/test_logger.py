@@ -17,6 +17,7 @@ from qbittorrent_monitor.logger import (
     ColoredFormatter,
     DetailedFormatter,
     StructuredLogger,
+    TimeAndSizeRotatingHandler,
     create_formatter,
     setup_logging,
     get_logger,
@@ -105,6 +106,17 @@ class TestJsonFormatter(TestCase):
         self.assertIn("host", data)
         self.assertEqual(data["project"], "qb-monitor")
     
+    def test_timestamp_uses_record_created(self):
+        """测试时间戳取自记录创建时间（UTC）"""
+        self.record.created = 1700000000.25
+        data = json.loads(self.formatter.format(self.record))
+        self.assertEqual(data["timestamp"], "2023-11-14T22:13:20.250000Z")
+        
+        # 同一秒内复用秒级前缀，仅小数部分变化
+        self.record.created = 1700000000.5
+        data = json.loads(self.formatter.format(self.record))
+        self.assertEqual(data["timestamp"], "2023-11-14T22:13:20.500000Z")
+    
     def test_json_with_extra_fields(self):
         """测试带额外字段的 JSON 格式"""
         self.record.magnet_hash = "abc123"
@@ -237,6 +249,29 @@ class TestStructuredLogger(TestCase):
         self.assertEqual(record.b, 2)
 
 
+class TestTimeAndSizeRotatingHandler(TestCase):
+    """测试轮转文件处理器"""
+    
+    def test_should_rollover_by_size_without_stat(self):
+        """测试轮转判断只检查大小，不再逐条 stat 日志路径"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            handler = TimeAndSizeRotatingHandler(
+                Path(tmpdir) / "app.log", max_bytes=64, backup_count=1
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            try:
+                short = logging.LogRecord("t", logging.INFO, "", 0, "x", None, None)
+                long = logging.LogRecord("t", logging.INFO, "", 0, "x" * 100, None, None)
+                with mock.patch("os.path.isfile") as isfile, \
+                        mock.patch("os.path.exists") as exists:
+                    self.assertFalse(handler.shouldRollover(short))
+                    self.assertTrue(handler.shouldRollover(long))
+                isfile.assert_not_called()
+                exists.assert_not_called()
+            finally:
+                handler.close()
+
+
 class TestSetupLogging(TestCase):
     """测试日志设置函数"""
     
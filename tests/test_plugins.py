@@ -67,6 +67,29 @@ class FailingPlugin(BasePlugin):
         pass
 
 
+class DependentPlugin(BasePlugin):
+    """带依赖的测试插件"""
+    
+    def __init__(self, name: str, dependencies=None):
+        self._name = name
+        self._dependencies = list(dependencies or [])
+        super().__init__()
+    
+    @property
+    def metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name=self._name,
+            plugin_type=PluginType.CUSTOM,
+            dependencies=self._dependencies
+        )
+    
+    async def initialize(self) -> bool:
+        return True
+    
+    async def shutdown(self) -> None:
+        pass
+
+
 class TestNotifier(NotifierPlugin):
     """测试通知插件"""
     
@@ -374,7 +397,13 @@ class TestHookRegistry:
         """每个测试前重置钩子注册表"""
         registry = HookRegistry()
         registry.clear()
-    
+
+    def test_hook_type_is_str(self):
+        """测试钩子类型成员即其字符串值"""
+        assert isinstance(HookType.PRE_PROCESS, str)
+        assert HookType.PRE_PROCESS == "pre_process"
+        assert hash(HookType.PRE_PROCESS) == hash("pre_process")
+
     @pytest.mark.asyncio
     async def test_register_and_invoke(self):
         """测试注册和调用钩子"""
@@ -420,6 +449,32 @@ class TestHookRegistry:
         
         assert order == ["high", "normal", "low"]
     
+    @pytest.mark.asyncio
+    async def test_hook_same_priority_keeps_registration_order(self):
+        """测试同优先级钩子按注册顺序执行"""
+        registry = HookRegistry()
+        registry.clear()
+        
+        from qbittorrent_monitor.plugins.hooks import HookPriority
+        
+        order = []
+        
+        @registry.register(HookType.POST_PROCESS)
+        async def first(data):
+            order.append("first")
+        
+        @registry.register(HookType.POST_PROCESS, priority=HookPriority.HIGHEST)
+        async def urgent(data):
+            order.append("urgent")
+        
+        @registry.register(HookType.POST_PROCESS)
+        async def second(data):
+            order.append("second")
+        
+        await registry.invoke(HookType.POST_PROCESS, "test")
+        
+        assert order == ["urgent", "first", "second"]
+    
     @pytest.mark.asyncio
     async def test_invoke_filter(self):
         """测试过滤钩子链"""
@@ -587,6 +642,49 @@ class TestPluginManager:
         assert len(results) == 2
         assert all(results.values())
     
+    @pytest.mark.asyncio
+    async def test_dependency_order(self, manager):
+        """测试按依赖拓扑排序插件"""
+        for plugin in (
+            DependentPlugin("app", ["db", "cache"]),
+            DependentPlugin("cache", ["db"]),
+            DependentPlugin("db"),
+            DependentPlugin("standalone"),
+        ):
+            manager._plugins[plugin.name] = plugin
+        
+        order, unresolved = manager._dependency_order()
+        
+        assert order == ["db", "cache", "app", "standalone"]
+        assert unresolved == []
+    
+    @pytest.mark.asyncio
+    async def test_dependency_order_with_cycle(self, manager):
+        """测试循环依赖的插件不会进入拓扑顺序"""
+        for plugin in (
+            DependentPlugin("a", ["b"]),
+            DependentPlugin("b", ["a"]),
+            DependentPlugin("c"),
+        ):
+            manager._plugins[plugin.name] = plugin
+        
+        order, unresolved = manager._dependency_order()
+        
+        assert order == ["c"]
+        assert sorted(unresolved) == ["a", "b"]
+    
+    @pytest.mark.asyncio
+    async def test_find_dependency_cycle(self, manager):
+        """测试注册时检测循环依赖"""
+        for plugin in (
+            DependentPlugin("a", ["b"]),
+            DependentPlugin("b", ["c"]),
+        ):
+            manager._plugins[plugin.name] = plugin
+        
+        assert manager._find_dependency_cycle("c", ["a"]) == ["c", "a", "b", "c"]
+        assert manager._find_dependency_cycle("d", ["a"]) is None
+    
     @pytest.mark.asyncio
     async def test_get_stats(self, manager):
         """测试获取统计信息"""
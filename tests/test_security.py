@@ -292,6 +292,21 @@ class TestSensitiveDataFilter:
         # 应该保留前8位，隐藏后面的
         assert '12345678***' in filtered or '***' in filtered
     
+    def test_filter_record_only_once(self):
+        """测试同一记录经过多个过滤器时只脱敏一次"""
+        filter_instance = SensitiveDataFilter()
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 1, 'password="%s"', ("secret123",), None
+        )
+        
+        assert filter_instance.filter(record) is True
+        assert "secret123" not in record.getMessage()
+        
+        calls = []
+        filter_instance._filter_sensitive_data = lambda text: calls.append(text) or text
+        assert filter_instance.filter(record) is True
+        assert calls == []
+    
     def test_filter_dict(self):
         """测试字典过滤"""
         data = {
@@ -364,6 +364,24 @@ class TestAIClassifier:
         assert results[1].category == "other"
         assert results[1].confidence == 0.0
 
+    async def test_classify_batch_deduplicates_names(self, classifier: ContentClassifier) -> None:
+        """测试批量分类对规范化后相同的名称只分类一次"""
+        original_classify = classifier.classify
+        classified = []
+
+        async def spy_classify(name, **kwargs):
+            classified.append(name)
+            return await original_classify(name, **kwargs)
+
+        classifier.classify = spy_classify
+
+        names = ["Movie.2024.1080p", "  movie.2024.1080P ", "TV.Show.S01E01", "Movie.2024.1080p"]
+        results = await classifier.classify_batch(names)
+
+        assert len(results) == 4
+        assert classified == ["Movie.2024.1080p", "TV.Show.S01E01"]
+        assert results[0] is results[1] is results[3]
+
 
 # ============================================================================
 # TestAIClassificationWithMock - 带 Mock 的 AI 分类测试
@@ -430,10 +448,30 @@ class TestAIClassificationWithMock:
         ai_enabled_classifier.client.messages.create = Mock(return_value=mock_response)
         
         result = await ai_enabled_classifier._ai_classify_with_timeout("Test Name")
-        
+
         assert result is not None
         assert result.category == "other"
 
+    async def test_ai_classify_prefers_longest_category(self, ai_enabled_classifier: ContentClassifier) -> None:
+        """测试 AI 返回文本包含多个分类名时优先匹配更长的分类名"""
+        ai_enabled_classifier._keywords["tv_movies"] = ["telefilm"]
+        ai_enabled_classifier._ai_category_order = tuple(
+            sorted(ai_enabled_classifier._keywords, key=len, reverse=True)
+        )
+        mock_response = Mock()
+        mock_content = Mock()
+        mock_content.text = "分类: tv_movies"
+        mock_response.content = [mock_content]
+
+        ai_enabled_classifier.client = Mock()
+        ai_enabled_classifier.client.messages = Mock()
+        ai_enabled_classifier.client.messages.create = Mock(return_value=mock_response)
+
+        result = await ai_enabled_classifier._ai_classify_with_timeout("Some Telefilm")
+
+        assert result is not None
+        assert result.category == "tv_movies"
+
     async def test_ai_classify_timeout(self, ai_enabled_classifier: ContentClassifier) -> None:
         """测试 AI 分类超时"""
         ai_enabled_classifier.client = Mock()
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import threading
 import pytest
 from datetime import datetime
 from typing import List, Dict, Any
@@ -73,6 +73,18 @@ class TestMonitorStats:
         assert stats.avg_check_time_ms == 150.0
         assert len(stats._check_times) == 2
 
+    def test_record_check_time_window(self) -> None:
+        """测试检查耗时平均值只统计最近100次"""
+        stats = MonitorStats()
+
+        for _ in range(100):
+            stats.record_check_time(1000.0)
+        for _ in range(100):
+            stats.record_check_time(10.0)
+
+        assert len(stats._check_times) == 100
+        assert stats.avg_check_time_ms == pytest.approx(10.0)
+
     def test_to_dict(self) -> None:
         """测试转换为字典"""
         stats = MonitorStats()
@@ -231,6 +243,14 @@ class TestMagnetExtractor:
         assert MagnetExtractor._is_valid_magnet(valid) is True
         assert MagnetExtractor._is_valid_magnet(invalid) is False
 
+    def test_may_contain_magnet(self) -> None:
+        """测试磁力链接快速预判"""
+        magnet = "magnet:?xt=urn:btih:1234567890abcdef1234567890abcdef12345678"
+
+        assert MagnetExtractor.may_contain_magnet(f"see {magnet} here") is True
+        assert MagnetExtractor.may_contain_magnet("magnet:?xt=urn:btih:short") is False
+        assert MagnetExtractor.may_contain_magnet("x" * 100) is False
+
 
 # ============================================================================
 # TestClipboardMonitorBasics - 监控器基础测试
@@ -568,7 +588,6 @@ class TestClipboardMonitorWithMockPyperclip:
         """测试剪贴板无变化"""
         content = "same content"
         monitor._last_content = content
-        monitor._last_content_hash = hashlib.md5(content.encode()).hexdigest()
         
         with patch('qbittorrent_monitor.monitor.pyperclip.paste', return_value=content):
             initial_changes = monitor.stats.clipboard_changes
@@ -578,6 +597,38 @@ class TestClipboardMonitorWithMockPyperclip:
             # 不应该增加变化计数
             assert monitor.stats.clipboard_changes == initial_changes
 
+    async def test_check_clipboard_skips_while_read_pending(self, monitor: ClipboardMonitor) -> None:
+        """测试剪贴板读取挂起期间跳过检查，不新建线程"""
+        release = threading.Event()
+        
+        def hanging_paste() -> str:
+            release.wait(5)
+            return ""
+        
+        try:
+            with patch('qbittorrent_monitor.monitor.pyperclip.paste', side_effect=hanging_paste):
+                await monitor._check_clipboard()
+            assert monitor.stats.clipboard_timeouts == 1
+            executor = monitor._clipboard_executor
+            pending = monitor._clipboard_future
+            assert pending is not None and not pending.done()
+            
+            # 挂起期间的轮询只计为超时，不会派发新的读取
+            with patch('qbittorrent_monitor.monitor.pyperclip.paste', return_value="new content") as paste:
+                await monitor._check_clipboard()
+            paste.assert_not_called()
+            assert monitor.stats.clipboard_timeouts == 2
+            assert monitor._clipboard_executor is executor
+        finally:
+            release.set()
+        
+        # 挂起的读取返回后，复用同一线程池继续读取
+        pending.result(timeout=5)
+        with patch('qbittorrent_monitor.monitor.pyperclip.paste', return_value="new content"):
+            await monitor._check_clipboard()
+        assert monitor.stats.clipboard_changes == 1
+        assert monitor._clipboard_executor is executor
+
     async def test_check_clipboard_empty(self, monitor: ClipboardMonitor) -> None:
         """测试空剪贴板"""
         with patch('qbittorrent_monitor.monitor.pyperclip.paste', return_value=""):
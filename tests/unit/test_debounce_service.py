@@ -0,0 +1,69 @@
+"""防抖服务单元测试
+
+测试 DebounceService 的防抖窗口、过期清理和容量限制。
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from qbittorrent_monitor.core import debounce as debounce_module
+from qbittorrent_monitor.core.debounce import DebounceService
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """替换防抖模块使用的时钟"""
+    fake = FakeClock()
+    monkeypatch.setattr(debounce_module.time, "time", fake.time)
+    return fake
+
+
+# ============================================================================
+# TestDebounceService - 防抖服务测试
+# ============================================================================
+
+class TestDebounceService:
+    """防抖服务测试"""
+
+    def test_skip_within_window(self, clock: FakeClock) -> None:
+        """测试防抖窗口内重复出现的 hash 被跳过"""
+        service = DebounceService(debounce_seconds=1.0)
+
+        assert service.should_skip("a") is False
+        clock.now += 0.5
+        assert service.should_skip("a") is True
+
+    def test_refreshed_hash_survives_stale_heap_entry(self, clock: FakeClock) -> None:
+        """测试重新出现的 hash 不会被旧堆条目到期时误删"""
+        service = DebounceService(debounce_seconds=1.0, cleanup_multiplier=2.0)
+
+        assert service.should_skip("a") is False  # 旧条目在 +2.0 到期
+        clock.now += 1.5
+        assert service.should_skip("a") is False  # 刷新，新条目在 +3.5 到期
+
+        # 旧条目已到期被弹出，但刷新后的记录仍在防抖窗口内
+        clock.now += 0.7
+        assert service.should_skip("a") is True
+        assert "a" in service._entries
+
+    def test_entries_bounded_by_max_size(self, clock: FakeClock) -> None:
+        """测试条目数不超过 max_size，超出时淘汰最早的记录"""
+        service = DebounceService(debounce_seconds=60.0, max_size=3)
+
+        for i in range(10):
+            assert service.should_skip(f"hash{i}") is False
+            clock.now += 0.01
+            assert len(service._entries) <= 3
+
+        assert set(service._entries) == {"hash7", "hash8", "hash9"}
@@ -0,0 +1,37 @@
+"""资源监控单元测试
+
+测试资源统计的滑动窗口计算。
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+import pytest
+
+from qbittorrent_monitor.resource_monitor import ResourceSnapshot, ResourceStats
+
+
+# ============================================================================
+# TestResourceStats - 资源统计测试
+# ============================================================================
+
+class TestResourceStats:
+    """资源统计测试"""
+
+    def test_rolling_average(self) -> None:
+        """测试滑动窗口平均值（窗口满后淘汰旧快照）"""
+        stats = ResourceStats(snapshots=deque(maxlen=3))
+        for i in range(10):
+            stats.add_snapshot(ResourceSnapshot(
+                timestamp=float(i),
+                memory_mb=float(i),
+                cpu_percent=float(i * 2),
+                disk_mb=0.0,
+                thread_count=1,
+            ))
+        
+        assert len(stats.snapshots) == 3
+        assert stats.average_memory_mb == pytest.approx(8.0)
+        assert stats.average_cpu_percent == pytest.approx(16.0)
+        assert stats.peak_memory_mb == 9.0